@@ -5,18 +5,31 @@
 Simple session-based authentication using Python stdlib only.
 
 NO EXTERNAL DEPENDENCIES - Uses only:
-- hashlib (sha256 for password scrambling)
+- hashlib (sha512 for password scrambling)
+- hmac (constant-time comparison)
+- heapq (session expiry queue)
 - secrets (secure token generation)
-- datetime (session expiration)
+- base64 (token encoding)
+- threading (session pool lock)
+- time (monotonic session expiration)
+- datetime (session creation timestamp for display)
+- dataclasses (session records)
 
 This is a basic authentication system for internal use. NOT suitable for
 high-security production environments.
 """
 
+import base64
+import binascii
 import hashlib
+import heapq
+import hmac
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple
 
 # Import configuration from centralized config
 try:
@@ -31,7 +44,7 @@ except ImportError:
     DEFAULT_ADMIN_USERNAME = os.getenv("DEFAULT_ADMIN_USERNAME", "admin")
     DEFAULT_ADMIN_PASSWORD_HASH = os.getenv(
         "DEFAULT_ADMIN_PASSWORD_HASH",
-        "8c6976e5b5410415bde908bd4dee15dfb167a9c873fc4bb8a81f6f2ab448a918"  # sha256("admin")
+        "c7ad44cbad762a5da0a452f9e854fdc1e0e7a52a38015f23f3eab1d80b931dd472634dfac71cd34ebc35d16ab7fb8a90c81f975113d6c7538dc69dd8de9077ec"  # sha512("admin")
     )
     SESSION_TIMEOUT_HOURS = int(os.getenv("SESSION_TIMEOUT_HOURS", "8"))
 
@@ -40,17 +53,60 @@ except ImportError:
 #  In-Memory Session Store
 # --------------------------------------------------------------------------- #
 
-# Format: {token: {username: str, expires: datetime, created: datetime}}
-active_sessions: Dict[str, Dict[str, Any]] = {}
+@dataclass(slots=True)
+class Session:
+    """
+    A single logged-in session.
+
+    ``expires`` and ``last_activity`` are time.monotonic() seconds;
+    ``created`` is wall-clock time and only used for display.
+    """
+    username: str
+    created: datetime
+    expires: float
+    last_activity: float
+
+
+# Format: {raw token bytes: Session}
+# Keys are the 32 random bytes behind the URL-safe token handed to clients,
+# so lookups hash and compare short byte strings.
+active_sessions: Dict[bytes, Session] = {}
+
+# Min-heap of (expires, token key) so cleanup only touches expired entries.
+# Entries for sessions removed early (logout) are skipped lazily on pop.
+_expiry_heap: List[Tuple[float, bytes]] = []
+
+# Free list of retired Session records, reused by create_session so login /
+# logout churn does not allocate a new record every time
+_SESSION_POOL_MAX = 1024
+_session_pool: List[Session] = []
+_lock = threading.Lock()
+
+_TOKEN_BYTES = 32
+_TOKEN_LENGTH = 43  # len(base64url(32 bytes)) without padding
+
+_SESSION_TIMEOUT_SECONDS = SESSION_TIMEOUT_HOURS * 3600
+
+# Cleanup is housekeeping only (validate_session checks each token's own
+# expiry), so the hot path triggers it at most once per interval
+_CLEANUP_INTERVAL_SECONDS = 60.0
+_next_cleanup: float = 0.0
 
 
 # --------------------------------------------------------------------------- #
 #  Password Functions
 # --------------------------------------------------------------------------- #
 
+# Hex length of hashes produced before the switch to SHA-512
+_LEGACY_SHA256_HEX_LENGTH = 64
+
+
 def scramble_password(password: str) -> str:
     """
-    Simple password scrambling using SHA-256.
+    Simple password scrambling using SHA-512.
+
+    SHA-512 works on 64-bit words and is faster than SHA-256 on 64-bit CPUs
+    without SHA extensions. The hex digest is 128 characters long.
 
     NOTE: This is NOT bcrypt or proper password hashing!
     For internal use only. Use a proper password hashing library
@@ -64,15 +120,20 @@ def scramble_password(password: str) -> str:
     Returns
     -------
     str
-        SHA-256 hash in hexadecimal format
+        SHA-512 hash in hexadecimal format (128 characters)
     """
-    return hashlib.sha256(password.encode('utf-8')).hexdigest()
+    # usedforsecurity=False lets OpenSSL pick its fastest provider (SHA-NI /
+    # ARMv8 SHA2) without FIPS gating; the digest itself is unchanged
+    return hashlib.sha512(password.encode('utf-8'), usedforsecurity=False).hexdigest()
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
     """
     Verify a password against its hash.
 
+    Legacy 64-character SHA-256 hashes are still accepted so existing
+    .env files keep working until the hash is regenerated.
+
     Parameters
     ----------
     plain_password : str
@@ -85,7 +146,16 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
     bool
         True if password matches, False otherwise
     """
-    return scramble_password(plain_password) == password_hash
+    if len(password_hash) == _LEGACY_SHA256_HEX_LENGTH:
+        candidate = hashlib.sha256(
+            plain_password.encode('utf-8'), usedforsecurity=False
+        ).hexdigest()
+    else:
+        candidate = scramble_password(plain_password)
+
+    # Constant-time comparison so the response time does not leak how many
+    # leading characters of the hash matched
+    return hmac.compare_digest(candidate.encode(), password_hash.encode())
 
 
 # --------------------------------------------------------------------------- #
@@ -111,8 +181,8 @@ def authenticate_user(username: str, password: str) -> bool:
     bool
         True if authentication successful, False otherwise
     """
-    # Check username
-    if username != DEFAULT_ADMIN_USERNAME:
+    # Check username (constant-time to avoid username enumeration via timing)
+    if not hmac.compare_digest(username.encode(), DEFAULT_ADMIN_USERNAME.encode()):
         return False
 
     # Verify password
@@ -123,6 +193,41 @@ def authenticate_user(username: str, password: str) -> bool:
 #  Session Management
 # --------------------------------------------------------------------------- #
 
+def _token_key(token: str) -> Optional[bytes]:
+    """
+    Convert a client token back to its raw session key.
+
+    Returns None for anything that is not a well-formed token.
+    """
+    if len(token) != _TOKEN_LENGTH:
+        return None
+    try:
+        return base64.b64decode(token.encode("ascii") + b"=", altchars=b"-_", validate=True)
+    except (UnicodeEncodeError, binascii.Error):
+        return None
+
+
+def _acquire_session(username: str, created: datetime, expires: float,
+                     last_activity: float) -> Session:
+    """Take a Session record from the pool (or allocate one) and fill it."""
+    with _lock:
+        session = _session_pool.pop() if _session_pool else None
+    if session is None:
+        session = Session.__new__(Session)
+    session.username = username
+    session.created = created
+    session.expires = expires
+    session.last_activity = last_activity
+    return session
+
+
+def _release_session(session: Session) -> None:
+    """Return a removed Session record to the pool."""
+    with _lock:
+        if len(_session_pool) < _SESSION_POOL_MAX:
+            _session_pool.append(session)
+
+
 def create_session(username: str) -> str:
     """
     Create a new session for a user.
@@ -139,17 +244,15 @@ def create_session(username: str) -> str:
     str
         Session token (32-byte URL-safe random string)
     """
-    # Generate secure random token
-    token = secrets.token_urlsafe(32)
+    # Generate secure random token; store the raw bytes, hand out base64url
+    key = secrets.token_bytes(_TOKEN_BYTES)
+    token = base64.urlsafe_b64encode(key).rstrip(b"=").decode("ascii")
 
     # Store session
-    now = datetime.now()
-    active_sessions[token] = {
-        "username": username,
-        "created": now,
-        "expires": now + timedelta(hours=SESSION_TIMEOUT_HOURS),
-        "last_activity": now,
-    }
+    now = time.monotonic()
+    expires = now + _SESSION_TIMEOUT_SECONDS
+    active_sessions[key] = _acquire_session(username, datetime.now(), expires, now)
+    heapq.heappush(_expiry_heap, (expires, key))
 
     return token
 
@@ -158,7 +261,8 @@ def validate_session(token: str) -> Optional[str]:
     """
     Validate a session token and return username if valid.
 
-    Also updates last_activity timestamp and removes expired sessions.
+    Also updates last_activity timestamp. Expired sessions are swept at
+    most once per cleanup interval.
 
     Parameters
     ----------
@@ -170,24 +274,30 @@ def validate_session(token: str) -> Optional[str]:
     Optional[str]
         Username if session is valid, None otherwise
     """
-    # Clean expired sessions first (housekeeping)
-    cleanup_expired_sessions()
+    global _next_cleanup
 
-    # Check if token exists
-    if token not in active_sessions:
-        return None
+    now = time.monotonic()
 
-    session = active_sessions[token]
+    # Periodic housekeeping - not needed for correctness
+    if now >= _next_cleanup:
+        _next_cleanup = now + _CLEANUP_INTERVAL_SECONDS
+        cleanup_expired_sessions()
+
+    key = _token_key(token)
+    session = active_sessions.get(key) if key is not None else None
+    if session is None:
+        return None
 
     # Check if expired
-    if datetime.now() > session["expires"]:
-        del active_sessions[token]
+    if now > session.expires:
+        del active_sessions[key]
+        _release_session(session)
         return None
 
     # Update last activity
-    session["last_activity"] = datetime.now()
+    session.last_activity = now
 
-    return session["username"]
+    return session.username
 
 
 def invalidate_session(token: str) -> bool:
@@ -206,33 +316,40 @@ def invalidate_session(token: str) -> bool:
     bool
         True if session was found and deleted, False otherwise
     """
-    if token in active_sessions:
-        del active_sessions[token]
-        return True
-    return False
+    key = _token_key(token)
+    session = active_sessions.pop(key, None) if key is not None else None
+    if session is None:
+        return False
+    _release_session(session)
+    return True
 
 
 def cleanup_expired_sessions() -> int:
     """
     Remove all expired sessions from memory.
 
-    Called periodically during session validation.
+    Called at most once per minute from session validation. Pops entries off the
+    expiry heap, so the cost is proportional to the number of expired
+    sessions rather than the number of active ones.
 
     Returns
     -------
     int
         Number of sessions removed
     """
-    now = datetime.now()
-    expired_tokens = [
-        token for token, session in active_sessions.items()
-        if now > session["expires"]
-    ]
+    now = time.monotonic()
+    removed = 0
 
-    for token in expired_tokens:
-        del active_sessions[token]
+    while _expiry_heap and _expiry_heap[0][0] < now:
+        expires, key = heapq.heappop(_expiry_heap)
+        session = active_sessions.get(key)
+        # Skip entries whose session was already invalidated
+        if session is not None and session.expires == expires:
+            del active_sessions[key]
+            _release_session(session)
+            removed += 1
 
-    return len(expired_tokens)
+    return removed
 
 
 def get_active_sessions_count() -> int:
@@ -266,12 +383,12 @@ def generate_password_hash(password: str) -> str:
     Returns
     -------
     str
-        SHA-256 hash to store in DEFAULT_ADMIN_PASSWORD_HASH
+        SHA-512 hash to store in DEFAULT_ADMIN_PASSWORD_HASH
 
     Example
     -------
     >>> generate_password_hash("mypassword")
-    '89e01536ac207279409d4de1e5253e01f4a1769e696db0d6062ca9b8f56767c8'
+    'a336f671080fbf4f2a230f313560ddf0d0c12dfcf1741e49e8722a234673037dc493caa8d291d8025f71089d63cea809cc8ae53e5b17054806837dbe4099c4ca'
     """
     return scramble_password(password)
 
@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Sparse-matrix BM25 index shared by the ingestor and the retriever.
+
+``SparseBM25`` is a drop-in replacement for ``rank_bm25.BM25Okapi``: same
+Okapi scoring (k1, b, and the epsilon floor for negative IDFs) and the same
+``get_scores(tokens)`` API, but the postings are a ``scipy.sparse`` CSR
+matrix (term × document) and ``idf`` / ``doc_len`` are numpy arrays. Scoring
+a query touches only the rows of its terms, as vectorized numpy operations,
+instead of looping over one Python dict per document; pickling writes a
+handful of flat arrays rather than millions of small dicts.
+
+Each posting's BM25 contribution, ``idf * tf * (k1 + 1) / (tf + norm)``,
+depends only on the term and the document, so it is precomputed once into
+``impact`` (same layout as ``tf``); a query is then a single weighted
+``bincount`` over the postings of its terms.
+
+On disk (``save_index`` / ``load_index``) the index is two files next to
+the configured index path: ``<stem>.<n>.arrays`` holds the numpy arrays
+back to back (64-byte aligned) and is memory-mapped on load, so pages are
+only read as queries touch them; ``<stem>.json`` names that file and holds
+the parameters, the array layout, the vocabulary, and the chunk texts and
+metadata. Each save writes a new generation ``n``. Indexes written by older
+versions (a fixed ``<stem>.arrays`` name, or a pickle) are still loaded.
+"""
+
+import os
+import pickle
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import orjson
+from scipy.sparse import csc_matrix, csr_matrix
+
+INDEX_FORMAT_VERSION = 2
+
+# Alignment of every array in an .arrays file
+_ALIGN = 64
+
+# Arrays written to disk, in file order
+_ARRAY_FIELDS = ("tf_data", "tf_indices", "tf_indptr", "doc_len", "idf", "norm", "impact_data")
+
+
+class SparseBM25:
+    """
+    Okapi BM25 over a term × document CSR matrix of term frequencies.
+
+    Parameters
+    ----------
+    corpus : Sequence[Sequence[str]]
+        Tokenized documents.
+    k1, b, epsilon : float
+        BM25Okapi parameters (same defaults as ``rank_bm25``).
+    """
+
+    def __init__(
+            self,
+            corpus: Sequence[Sequence[str]],
+            k1: float = 1.5,
+            b: float = 0.75,
+            epsilon: float = 0.25,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+
+        vocab: Dict[str, int] = {}
+        indptr: List[int] = [0]
+        indices: List[int] = []
+        data: List[int] = []
+        doc_len: List[int] = []
+        for doc in corpus:
+            for term, freq in Counter(doc).items():
+                indices.append(vocab.setdefault(term, len(vocab)))
+                data.append(freq)
+            indptr.append(len(indices))
+            doc_len.append(len(doc))
+
+        self.vocab = vocab
+        self.corpus_size = len(doc_len)
+        # Document-major arrays read as CSC are the term × document matrix;
+        # CSR makes each term's postings one contiguous row
+        self.tf = csc_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32),
+             np.asarray(indptr, dtype=np.int64)),
+            shape=(len(vocab), self.corpus_size),
+        ).tocsr()
+        self.doc_len = np.asarray(doc_len, dtype=np.float32)
+        self.avgdl = float(self.doc_len.mean()) if self.corpus_size else 0.0
+
+        # Okapi IDF; negative values are floored at epsilon * average IDF
+        df = np.diff(self.tf.indptr).astype(np.float64)
+        idf = np.log(self.corpus_size - df + 0.5) - np.log(df + 0.5)
+        if idf.size:
+            idf[idf < 0] = self.epsilon * idf.mean()
+        self.idf = idf
+
+        # Per-document length normalization, k1 * (1 - b + b * dl / avgdl)
+        self.norm = self.k1 * (1 - self.b + self.b * self.doc_len / (self.avgdl or 1.0))
+
+        self.impact = self._impact_matrix()
+
+    @classmethod
+    def _from_arrays(cls, params: Dict[str, Any], vocab: Sequence[str],
+                     arrays: Dict[str, np.ndarray]) -> "SparseBM25":
+        """Rebuild an index from ``_to_arrays`` output without copying the arrays."""
+        self = cls.__new__(cls)
+        self.k1 = params["k1"]
+        self.b = params["b"]
+        self.epsilon = params["epsilon"]
+        self.avgdl = params["avgdl"]
+        self.corpus_size = params["corpus_size"]
+        self.vocab = {term: i for i, term in enumerate(vocab)}
+        shape = (len(vocab), self.corpus_size)
+        self.tf = csr_matrix((arrays["tf_data"], arrays["tf_indices"], arrays["tf_indptr"]), shape=shape)
+        self.impact = csr_matrix((arrays["impact_data"], arrays["tf_indices"], arrays["tf_indptr"]), shape=shape)
+        self.doc_len = arrays["doc_len"]
+        self.idf = arrays["idf"]
+        self.norm = arrays["norm"]
+        return self
+
+    def _to_arrays(self) -> Tuple[Dict[str, Any], List[str], Dict[str, np.ndarray]]:
+        """Parameters, vocabulary in id order, and the arrays of ``_ARRAY_FIELDS``."""
+        params = {
+            "k1": self.k1,
+            "b": self.b,
+            "epsilon": self.epsilon,
+            "avgdl": self.avgdl,
+            "corpus_size": self.corpus_size,
+        }
+        impact = getattr(self, "impact", None)
+        if impact is None:
+            impact = self._impact_matrix()
+        arrays = {
+            "tf_data": self.tf.data,
+            "tf_indices": self.tf.indices,
+            "tf_indptr": self.tf.indptr,
+            "doc_len": self.doc_len,
+            "idf": self.idf,
+            "norm": self.norm,
+            "impact_data": impact.data,
+        }
+        # vocab ids were assigned in insertion order
+        return params, list(self.vocab), arrays
+
+    def _impact_matrix(self) -> csr_matrix:
+        """Term × document matrix of per-posting BM25 contributions."""
+        tf = self.tf
+        terms = np.repeat(np.arange(tf.shape[0]), np.diff(tf.indptr))
+        data = self.idf[terms] * (tf.data * (self.k1 + 1) / (tf.data + self.norm[tf.indices]))
+        return csr_matrix((data, tf.indices, tf.indptr), shape=tf.shape)
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """BM25 score of every document for the tokenized ``query``."""
+        impact = getattr(self, "impact", None)
+        if impact is None:
+            # Index pickled before impacts were stored
+            impact = self.impact = self._impact_matrix()
+
+        # Repeated query terms count once per occurrence, as in rank_bm25
+        ids = [t for t in map(self.vocab.get, query) if t is not None]
+        if not ids:
+            return np.zeros(self.corpus_size)
+
+        indptr = impact.indptr
+        docs = np.concatenate([impact.indices[indptr[t]:indptr[t + 1]] for t in ids])
+        weights = np.concatenate([impact.data[indptr[t]:indptr[t + 1]] for t in ids])
+        return np.bincount(docs, weights=weights, minlength=self.corpus_size)
+
+
+# --------------------------------------------------------------------------- #
+#  Persistence
+# --------------------------------------------------------------------------- #
+def meta_file(path: Path) -> Path:
+    """The ``.json`` file of the index at ``path``; replacing it publishes an index."""
+    return Path(path).with_suffix(".json")
+
+
+def _arrays_generations(path: Path) -> Dict[int, Path]:
+    """Every ``<stem>.<n>.arrays`` file next to ``path``, by generation ``n``."""
+    path = Path(path)
+    pattern = re.compile(re.escape(path.stem) + r"\.(\d+)\.arrays")
+    generations = {}
+    try:
+        for file in path.parent.iterdir():
+            m = pattern.fullmatch(file.name)
+            if m:
+                generations[int(m.group(1))] = file
+    except FileNotFoundError:
+        pass
+    return generations
+
+
+def _remove_files(files: Iterable[Path]) -> bool:
+    """
+    Delete ``files`` best-effort; True if any existed.
+
+    Files that cannot be deleted are skipped: on Windows an arrays file
+    stays locked while a server process has it memory-mapped. A later
+    save removes it.
+    """
+    removed = False
+    for file in files:
+        try:
+            file.unlink()
+            removed = True
+        except FileNotFoundError:
+            pass
+        except OSError:
+            removed = True
+    return removed
+
+
+def remove_index(path: Path) -> bool:
+    """Delete the index files (and any legacy pickle); True if any existed."""
+    path = Path(path)
+    # The JSON first: without it, no reader picks up the arrays
+    return _remove_files([
+        meta_file(path),
+        *_arrays_generations(path).values(),
+        path.with_suffix(".arrays"),
+        path,
+    ])
+
+
+def save_index(path: Path, bm25: SparseBM25, chunks: Sequence[str],
+               metadatas: Sequence[Dict[str, Any]]) -> None:
+    """
+    Write ``bm25`` with its chunks and metadata as ``.arrays`` + ``.json``.
+
+    The arrays go to a new ``<stem>.<n>.arrays`` file, named in the JSON,
+    which is written under a temporary name and renamed into place. That
+    rename is the only replacement, so a reader sees either the old index
+    or the new one, and a memory-mapped older generation (which Windows
+    will not let anyone delete or replace) never blocks a save. Older
+    generations are deleted afterwards where possible.
+    """
+    path = Path(path)
+    generations = _arrays_generations(path)
+    arrays_file = path.with_name(f"{path.stem}.{max(generations, default=0) + 1}.arrays")
+    params, vocab, arrays = bm25._to_arrays()
+
+    layout: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    with open(arrays_file, "wb") as f:
+        for name in _ARRAY_FIELDS:
+            arr = np.ascontiguousarray(arrays[name])
+            pad = -offset % _ALIGN
+            f.write(b"\0" * pad)
+            offset += pad
+            f.write(memoryview(arr).cast("B"))
+            layout[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+            offset += arr.nbytes
+
+    meta = {
+        "version": INDEX_FORMAT_VERSION,
+        "params": params,
+        "arrays_file": arrays_file.name,
+        "arrays": layout,
+        "vocab": vocab,
+        "chunks": list(chunks),
+        "metadatas": list(metadatas),
+    }
+    meta_path = meta_file(path)
+    tmp_meta = meta_path.with_name(meta_path.name + ".tmp")
+    tmp_meta.write_bytes(orjson.dumps(meta, option=orjson.OPT_SERIALIZE_NUMPY))
+    os.replace(tmp_meta, meta_path)
+
+    # Older generations, the fixed-name file of format 1 and any legacy
+    # pickle are stale now
+    _remove_files([*generations.values(), path.with_suffix(".arrays"), path])
+
+
+def load_index(path: Path) -> Dict[str, Any]:
+    """
+    Load the index at ``path`` as ``{"bm25", "chunks", "metadatas"}``.
+
+    The arrays are memory-mapped read-only. Falls back to the pickle
+    written by older versions when there is no ``.json`` file.
+    """
+    path = Path(path)
+    meta_path = meta_file(path)
+    for attempt in range(3):
+        if not meta_path.exists():
+            with open(path, "rb") as f:
+                return pickle.load(f)
+
+        meta = orjson.loads(meta_path.read_bytes())
+        version = meta.get("version")
+        if version not in (1, INDEX_FORMAT_VERSION):
+            raise ValueError(f"Unsupported BM25 index version {version!r} in {meta_path}")
+
+        # Format 1 used a fixed file name
+        arrays_file = path.with_name(meta.get("arrays_file", path.stem + ".arrays"))
+        try:
+            if arrays_file.stat().st_size:
+                buf = np.memmap(arrays_file, dtype=np.uint8, mode="r")
+            else:
+                buf = np.empty(0, dtype=np.uint8)
+            break
+        except FileNotFoundError:
+            # A save published a new generation and removed this one
+            # between reading the JSON and opening the arrays
+            if attempt == 2:
+                raise
+
+    arrays = {}
+    for name, spec in meta["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = spec["offset"]
+        arrays[name] = buf[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+
+    bm25 = SparseBM25._from_arrays(meta["params"], meta["vocab"], arrays)
+    return {"bm25": bm25, "chunks": meta["chunks"], "metadatas": meta["metadatas"]}
@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 
@@ -15,7 +16,7 @@ VECTOR_DB_COLLECTION_NAME = os.getenv("VECTOR_DB_COLLECTION_NAME")  # The collec
 DEFAULT_ADMIN_USERNAME = os.getenv("DEFAULT_ADMIN_USERNAME", "admin")
 DEFAULT_ADMIN_PASSWORD_HASH = os.getenv(
     "DEFAULT_ADMIN_PASSWORD_HASH",
-    "8c6976e5b5410415bde908bd4dee15dfb167a9c873fc4bb8a81f6f2ab448a918"  # sha256("admin")
+    "c7ad44cbad762a5da0a452f9e854fdc1e0e7a52a38015f23f3eab1d80b931dd472634dfac71cd34ebc35d16ab7fb8a90c81f975113d6c7538dc69dd8de9077ec"  # sha512("admin")
 )
 SESSION_TIMEOUT_HOURS = int(os.getenv("SESSION_TIMEOUT_HOURS", "8"))
 
@@ -49,6 +50,11 @@ PATH_MODEL_NER = _resolve_path("PATH_MODEL_NER", _BASE_PATH / "models" / "bert-b
 PATH_VECTOR_DB_STORAGE = _resolve_path("PATH_VECTOR_DB_STORAGE", _BASE_PATH / "chroma_store")
 PATH_BM25_INDEX_FILE = _resolve_path("PATH_BM25_INDEX_FILE", _BASE_PATH / "chroma_store" / "bm25_index.pkl")
 
+# Embedder backend for ingestion and query encoding: "torch"
+# (SentenceTransformer, FP32) or "onnx-int8" (ONNX Runtime with a dynamically
+# quantized INT8 export). Re-ingest after changing it.
+EMBEDDER_BACKEND = os.getenv("EMBEDDER_BACKEND", "torch").strip().lower()
+
 folders_to_ensure = [
     PATH_DOCUMENTS,
     PATH_MODEL_EMBEDDER,
@@ -78,6 +84,21 @@ def configure_offline_mode():
         "POSTHOG_DISABLED": "1",
     })
 
+def _resolve_instruction_path(env_var_name: str, default_filename: str = None) -> Path | None:
+    """Resolve an instruction file path from env var or default, relative to the project root."""
+    file_path = os.getenv(env_var_name) or default_filename
+    if not file_path:
+        return None
+    file_path = Path(file_path)
+    return file_path if file_path.is_absolute() else _BASE_PATH / file_path
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text_cached(path: str, mtime: float) -> str:
+    """Read and strip a text file; cached per (path, mtime) so edits are picked up."""
+    return Path(path).read_text(encoding='utf-8').strip()
+
+
 def _load_instruction_file(env_var_name: str, default_filename: str = None) -> str:
     """
     Load instruction text from external file.
@@ -89,42 +110,43 @@ def _load_instruction_file(env_var_name: str, default_filename: str = None) -> s
     Returns:
         Instruction text content
     """
-    file_path = os.getenv(env_var_name)
-
-    # If no env var, use default
-    if not file_path and default_filename:
-        file_path = Path(__file__).parent.parent / default_filename
-    elif not file_path:
+    file_path = _resolve_instruction_path(env_var_name, default_filename)
+    if file_path is None:
         return ""
 
-    # Convert to Path and resolve
-    file_path = Path(file_path)
-    if not file_path.is_absolute():
-        file_path = Path(__file__).parent.parent / file_path
-
     # Read file content
     try:
-        if file_path.exists():
-            return file_path.read_text(encoding='utf-8').strip()
-        else:
-            print(f"Warning: Instruction file not found: {file_path}")
-            return ""
+        return _read_text_cached(str(file_path), file_path.stat().st_mtime)
+    except FileNotFoundError:
+        print(f"Warning: Instruction file not found: {file_path}")
+        return ""
     except Exception as e:
         print(f"Error loading instruction file {file_path}: {e}")
         return ""
 
+# Instruction texts: name -> (file env var, default file). The name doubles as
+# the env var holding inline text, used when the file is missing or empty.
+_INSTRUCTION_SOURCES = {
+    "MCP_SERVER_INSTRUCTION": (
+        "MCP_SERVER_INSTRUCTION_FILE",
+        "config/instructions/mcp_server_instruction.txt",
+    ),
+    "SEARCH_DOCUMENT_TOOL_DESCRIPTION": (
+        "SEARCH_DOCUMENT_TOOL_DESCRIPTION_FILE",
+        "config/instructions/search_document_tool_description.txt",
+    ),
+    "LIST_DOCUMENTS_TOOL_DESCRIPTION": (
+        "LIST_DOCUMENTS_TOOL_DESCRIPTION_FILE",
+        "config/instructions/list_documents_instruction.txt",
+    ),
+}
+
 # Load instruction texts from external files (with fallback to env vars)
-MCP_SERVER_INSTRUCTION = _load_instruction_file(
-    "MCP_SERVER_INSTRUCTION_FILE",
-    "config/instructions/mcp_server_instruction.txt"
-) or os.getenv("MCP_SERVER_INSTRUCTION", "")
-
-SEARCH_DOCUMENT_TOOL_DESCRIPTION = _load_instruction_file(
-    "SEARCH_DOCUMENT_TOOL_DESCRIPTION_FILE",
-    "config/instructions/search_document_tool_description.txt"
-) or os.getenv("SEARCH_DOCUMENT_TOOL_DESCRIPTION", "")
-
-LIST_DOCUMENTS_TOOL_DESCRIPTION = _load_instruction_file(
-    "LIST_DOCUMENTS_TOOL_DESCRIPTION_FILE",
-    "config/instructions/list_documents_instruction.txt"
-) or os.getenv("LIST_DOCUMENTS_TOOL_DESCRIPTION", "")
\ No newline at end of file
+INSTRUCTIONS = {
+    name: _load_instruction_file(env_var, default_file) or os.getenv(name, "")
+    for name, (env_var, default_file) in _INSTRUCTION_SOURCES.items()
+}
+
+MCP_SERVER_INSTRUCTION = INSTRUCTIONS["MCP_SERVER_INSTRUCTION"]
+SEARCH_DOCUMENT_TOOL_DESCRIPTION = INSTRUCTIONS["SEARCH_DOCUMENT_TOOL_DESCRIPTION"]
+LIST_DOCUMENTS_TOOL_DESCRIPTION = INSTRUCTIONS["LIST_DOCUMENTS_TOOL_DESCRIPTION"]
@@ -5,12 +5,17 @@ Ultra-simple, single file Python implementation
 """
 import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from email.utils import formatdate
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import quote
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from requests_ntlm import HttpNtlmAuth
 
 import config
@@ -26,13 +31,162 @@ LIBRARY_NAME = config.PORTAL_LIBRARY_NAME
 OUTPUT_FOLDER = config.PATH_DOCUMENTS
 
 MAX_RESULTS = 5000
+LIST_PAGE_SIZE = 500  # Items per listing page; downloads start after the first page
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes written per chunk when streaming files
+MAX_WORKERS = 8  # Parallel downloads (I/O bound, so threads are enough)
 IGNORE_CERT = True  # Set to False in production!
 
+# Characters not allowed in Windows file names, replaced with "_"
+_SANITIZE_TABLE = str.maketrans('<>:"/\\|?*', '_________')
+
 # Disable SSL warnings if IGNORE_CERT is True
 if IGNORE_CERT:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+# ============================================================================
+# DOWNLOAD HELPERS
+# ============================================================================
+
+# Serializes progress output from the download threads
+_print_lock = threading.Lock()
+
+# Per-file download outcomes returned by _download_one
+STATUS_DOWNLOADED = "downloaded"
+STATUS_SKIPPED = "skipped"  # Unchanged since last run (HTTP 304)
+STATUS_FAILED = "failed"
+
+
+def _log(message: str) -> None:
+    """Print a progress line without interleaving output from other threads."""
+    with _print_lock:
+        print(message)
+
+
+def _scan_local_mtimes(folder: Path) -> Dict[str, float]:
+    """Map each file name in the download folder to its modification time."""
+    with os.scandir(folder) as entries:
+        return {
+            entry.name: entry.stat().st_mtime
+            for entry in entries
+            if entry.is_file()
+        }
+
+
+def _parse_sharepoint_time(value: str) -> Optional[float]:
+    """Convert a SharePoint ``Modified`` value (ISO-8601, UTC) to a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _iter_file_pages(session: requests.Session, url: str) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the library's file items one listing page at a time.
+
+    Follows ``odata.nextLink`` until the server stops returning one or
+    MAX_RESULTS items have been listed. Request errors propagate to the
+    caller.
+    """
+    listed = 0
+    while url and listed < MAX_RESULTS:
+        # odata=nometadata drops the per-item __metadata blocks, roughly
+        # halving the payload that has to be transferred and parsed
+        response = session.get(
+            url,
+            headers={"Accept": "application/json;odata=nometadata"},
+            timeout=30
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        # nometadata puts items under "value" and the next page URL
+        # (with its $skiptoken) under "odata.nextLink"
+        page: List[Dict[str, Any]] = data.get("value", [])[:MAX_RESULTS - listed]
+        listed += len(page)
+        yield page
+        url = data.get("odata.nextLink")
+
+
+def _download_one(
+    session: requests.Session,
+    download_folder: Path,
+    local_mtimes: Dict[str, float],
+    file_info: Dict[str, Any],
+    position: str,
+) -> Optional[str]:
+    """
+    Download a single SharePoint file into the download folder.
+
+    If a local copy exists, a conditional GET (If-Modified-Since) is sent
+    and an HTTP 304 leaves the file untouched. New content is written to a
+    ``.part`` file unique to the downloading thread and moved into place
+    with os.replace, so an interrupted run never leaves a truncated
+    document behind.
+
+    Returns one of the STATUS_* constants, or None when the list item has
+    no file name or URL.
+    """
+    file_name: str = file_info.get("FileLeafRef", "")
+    file_url_path: str = file_info.get("FileRef", "")
+
+    if not file_name or not file_url_path:
+        return None
+
+    try:
+        # Sanitize filename (remove invalid characters)
+        safe_name = file_name.translate(_SANITIZE_TABLE)
+        local_path = os.path.join(download_folder, safe_name)
+        # Per-thread name: items with the same leaf name in different
+        # folders may be downloading at the same time
+        part_path = f"{local_path}.{threading.get_ident()}.part"
+
+        headers = {}
+        local_mtime = local_mtimes.get(safe_name)
+        if local_mtime is not None:
+            headers["If-Modified-Since"] = formatdate(local_mtime, usegmt=True)
+
+        # Stream file to disk so memory use stays at one chunk regardless
+        # of file size
+        file_url = SITE_URL + file_url_path
+        total_bytes = 0
+        with session.get(file_url, headers=headers, timeout=60, stream=True) as file_response:
+            if file_response.status_code == 304:
+                _log(f"[{position}] ⏭️  {file_name} (unchanged)")
+                return STATUS_SKIPPED
+
+            file_response.raise_for_status()
+            try:
+                with open(part_path, "wb") as f:
+                    for chunk in file_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        total_bytes += len(chunk)
+                os.replace(part_path, local_path)
+            except BaseException:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+                raise
+
+        # Stamp the remote modification time so the next run's
+        # If-Modified-Since matches the server's view of the file
+        remote_ts = _parse_sharepoint_time(file_info.get("Modified", ""))
+        if remote_ts is not None:
+            os.utime(local_path, (remote_ts, remote_ts))
+
+        size_kb = total_bytes / 1024
+        _log(f"[{position}] ✅ {file_name} ({size_kb:.1f} KB)")
+        return STATUS_DOWNLOADED
+
+    except Exception as e:
+        _log(f"[{position}] ❌ {file_name}: {e}")
+        return STATUS_FAILED
+
+
 # ============================================================================
 # MAIN FUNCTION
 # ============================================================================
@@ -53,6 +207,12 @@ def main() -> None:
     session = requests.Session()
     session.auth = auth
 
+    # Mounted before the first request so the NTLM handshake happens on
+    # pooled keep-alive connections: one per worker plus one for listing
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS + 1)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
     if IGNORE_CERT:
         session.verify = False
         print("⚠️  WARNING: SSL certificate verification is DISABLED!\n")
@@ -60,75 +220,50 @@ def main() -> None:
     # Build SharePoint REST API URL
     encoded_library = quote(LIBRARY_NAME)
     api_url = f"{SITE_URL}/_api/web/lists/getbytitle('{encoded_library}')/items"
-    query = f"?$filter=FSObjType eq 0&$select=FileRef,FileLeafRef&$top={MAX_RESULTS}"
+    query = f"?$filter=FSObjType eq 0&$select=FileRef,FileLeafRef,Modified&$top={LIST_PAGE_SIZE}"
     full_url = api_url + query
 
-    # Fetch file list from SharePoint
-    print("📡 Fetching file list from SharePoint...")
-    try:
-        response = session.get(
-            full_url,
-            headers={"Accept": "application/json;odata=verbose"},
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Failed to fetch file list: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Failed to parse response: {e}")
-        sys.exit(1)
-
-    # Extract files from JSON response
-    files: List[Dict[str, Any]] = data.get("d", {}).get("results", [])
-    print(f"📋 Found {len(files)} files\n")
-
-    if len(files) == 0:
-        print("⚠️  No files found")
-        return
-
     # Create output directory
     download_folder = (Path(__file__).parent.parent.parent / OUTPUT_FOLDER).resolve()
 
     os.makedirs(download_folder, exist_ok=True)
+    local_mtimes = _scan_local_mtimes(download_folder)
 
-    # Download files
-    success_count: int = 0
-    fail_count: int = 0
-
-    for i, file_info in enumerate(files, 1):
-        file_name: str = file_info.get("FileLeafRef", "")
-        file_url_path: str = file_info.get("FileRef", "")
-
-        if not file_name or not file_url_path:
-            continue
-
-        print(f"[{str(i)}/{str(len(files))}] Downloading: {file_name}")
-
+    # Fetch the file list page by page and queue each page for download
+    # as soon as it arrives, so listing overlaps with downloading
+    print("📡 Fetching file list from SharePoint...")
+    print(f"⬇️  Downloading with {MAX_WORKERS} parallel workers...")
+    futures: List[Future] = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         try:
-            # Download file
-            file_url = SITE_URL + file_url_path
-            file_response = session.get(file_url, timeout=60)
-            file_response.raise_for_status()
-
-            # Sanitize filename (remove invalid characters)
-            safe_name = file_name.translate(str.maketrans('<>:"/\\|?*', '_________'))
+            for page in _iter_file_pages(session, full_url):
+                for file_info in page:
+                    futures.append(executor.submit(
+                        _download_one, session, download_folder, local_mtimes,
+                        file_info, str(len(futures) + 1)
+                    ))
+        except requests.exceptions.RequestException as e:
+            _log(f"❌ Failed to fetch file list: {e}")
+            if not futures:
+                sys.exit(1)
+        except Exception as e:
+            _log(f"❌ Failed to parse response: {e}")
+            if not futures:
+                sys.exit(1)
 
-            # Save file (overwrites if exists)
-            local_path = os.path.join(download_folder, safe_name)
-            with open(local_path, "wb") as f:
-                f.write(file_response.content)
+        _log(f"📋 Found {len(futures)} files\n")
+        results = [future.result() for future in futures]
 
-            size_kb = len(file_response.content) / 1024
-            print(f"  ✅ Saved ({size_kb:.1f} KB)")
-            success_count += 1
+    if len(results) == 0:
+        print("⚠️  No files found")
+        return
 
-        except Exception as e:
-            print(f"  ❌ Failed: {e}")
-            fail_count += 1
+    success_count: int = results.count(STATUS_DOWNLOADED)
+    skipped_count: int = results.count(STATUS_SKIPPED)
+    fail_count: int = results.count(STATUS_FAILED)
 
     print(f"\n🎉 Download complete!")
     print(f"   Success: {success_count} files")
+    print(f"   Unchanged: {skipped_count} files")
     print(f"   Failed: {fail_count} files")
 
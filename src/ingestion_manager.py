@@ -41,6 +41,26 @@ _error_message: Optional[str] = None
 _file_operations_locked = False
 _lock = threading.RLock()  # Use RLock (reentrant) to allow nested lock acquisition
 
+# Memory model: _lock serializes state *transitions* (start, stop, process
+# completion, lock/unlock). Readers do not take it: rebinding a module global
+# to an immutable value is atomic under the GIL, so a reader always sees
+# either the old or the new value, never a torn one. get_status() copies the
+# globals into locals first so its dict is built from one snapshot.
+
+
+# Bytes of the ingestion log included in the error message on failure
+_ERROR_TAIL_BYTES = 500
+
+# Subprocess paths, resolved once at import instead of on every start
+_PYTHON_EXE = sys.executable
+_SRC_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SRC_DIR.parent
+_SCRIPT_PATH = _SRC_DIR / "ingestor" / "ingest.py"
+_SCRIPT_FOUND = _SCRIPT_PATH.exists()
+
+if not _SCRIPT_FOUND:
+    _logger.warning(f"Ingestion script not found: {_SCRIPT_PATH}")
+
 
 # --------------------------------------------------------------------------- #
 #  Status Management
@@ -62,21 +82,28 @@ def get_status() -> Dict[str, Any]:
         - file_operations_locked: bool
         - process_id: int or None
     """
-    with _lock:
-        duration = None
-        if _start_time:
-            end = _end_time or datetime.now()
-            duration = (end - _start_time).total_seconds()
-
-        return {
-            "status": _status,
-            "start_time": _start_time.isoformat() if _start_time else None,
-            "end_time": _end_time.isoformat() if _end_time else None,
-            "duration": duration,
-            "error_message": _error_message,
-            "file_operations_locked": _file_operations_locked,
-            "process_id": _process.pid if _process else None,
-        }
+    # Snapshot globals without locking (see memory model note above)
+    status = _status
+    process = _process
+    start_time = _start_time
+    end_time = _end_time
+    error_message = _error_message
+    file_operations_locked = _file_operations_locked
+
+    duration = None
+    if start_time:
+        end = end_time or datetime.now()
+        duration = (end - start_time).total_seconds()
+
+    return {
+        "status": status,
+        "start_time": start_time.isoformat() if start_time else None,
+        "end_time": end_time.isoformat() if end_time else None,
+        "duration": duration,
+        "error_message": error_message,
+        "file_operations_locked": file_operations_locked,
+        "process_id": process.pid if process else None,
+    }
 
 
 def is_running() -> bool:
@@ -88,8 +115,7 @@ def is_running() -> bool:
     bool
         True if ingestion is running, False otherwise
     """
-    with _lock:
-        return _status == "running"
+    return _status == "running"
 
 
 def are_file_operations_locked() -> bool:
@@ -101,8 +127,7 @@ def are_file_operations_locked() -> bool:
     bool
         True if file operations are locked, False otherwise
     """
-    with _lock:
-        return _file_operations_locked
+    return _file_operations_locked
 
 
 # --------------------------------------------------------------------------- #
@@ -126,6 +151,8 @@ def start_ingestion() -> Dict[str, Any]:
 
     _logger.info("start_ingestion() called")
 
+    # Claim the "running" slot under the lock, then spawn outside it so
+    # get_status()/check_process_status() callers don't wait on fork/exec
     with _lock:
         _logger.debug("Acquired lock")
 
@@ -141,73 +168,72 @@ def start_ingestion() -> Dict[str, Any]:
         # Reset state
         _logger.debug("Resetting state")
         _status = "running"
+        _process = None
         _start_time = datetime.now()
         _end_time = None
         _error_message = None
         _file_operations_locked = True
 
-        # Clear ingestion log file to show only new logs
-        try:
-            if INGESTION_LOG_FILE.exists():
-                INGESTION_LOG_FILE.unlink()
-                _logger.info(f"Cleared ingestion log file: {INGESTION_LOG_FILE}")
-            else:
-                _logger.debug(f"Ingestion log file does not exist yet: {INGESTION_LOG_FILE}")
-        except Exception as log_exc:
-            _logger.warning(f"Could not clear ingestion log file: {log_exc}")
-            # Continue anyway - this is not a critical error
-
-        try:
-            # Get Python executable and project root
-            _logger.debug("Getting Python executable and project root")
-            python_exe = sys.executable
-            project_root = Path(__file__).parent.parent  # Go up from src/ to project root
-            script_path = Path(__file__).parent / "ingestor" / "ingest.py"
-
-            _logger.debug(f"Python exe: {python_exe}")
-            _logger.debug(f"Script path: {script_path}")
-            _logger.debug(f"Project root: {project_root}")
-
-            if not script_path.exists():
-                _logger.error(f"Script not found: {script_path}")
-                raise FileNotFoundError(f"Ingestion script not found: {script_path}")
-
-            # Start subprocess - run as module to support relative imports
-            # Don't capture stdout/stderr - let subprocess write directly to its log file
-            # Capturing causes the process to hang when the pipe buffer fills up
-            _logger.info("Starting ingestion subprocess as module")
-            _process = subprocess.Popen(
-                [python_exe, "-m", "ingestor.ingest"],
-                stdout=None,  # Inherit parent's stdout (or redirect to console)
-                stderr=None,  # Inherit parent's stderr
-                cwd=project_root / "src",  # Run from src/ directory so module path works
-            )
-            _logger.info(f"Subprocess started with PID: {_process.pid}")
-
-            _logger.debug("Preparing return dict")
-            result = {
-                "success": True,
-                "message": "Ingestion started successfully",
-                "process_id": _process.pid,
-                "status": get_status()
-            }
-            _logger.info("Returning success from start_ingestion()")
-            return result
-
-        except Exception as exc:
-            _logger.error(f"Exception in start_ingestion(): {exc}", exc_info=True)
-            # Revert state on error
+    # Clear ingestion log file to show only new logs
+    try:
+        if INGESTION_LOG_FILE.exists():
+            INGESTION_LOG_FILE.unlink()
+            _logger.info(f"Cleared ingestion log file: {INGESTION_LOG_FILE}")
+        else:
+            _logger.debug(f"Ingestion log file does not exist yet: {INGESTION_LOG_FILE}")
+    except Exception as log_exc:
+        _logger.warning(f"Could not clear ingestion log file: {log_exc}")
+        # Continue anyway - this is not a critical error
+
+    try:
+        _logger.debug(f"Python exe: {_PYTHON_EXE}")
+        _logger.debug(f"Script path: {_SCRIPT_PATH}")
+        _logger.debug(f"Project root: {_PROJECT_ROOT}")
+
+        if not _SCRIPT_FOUND:
+            _logger.error(f"Script not found: {_SCRIPT_PATH}")
+            raise FileNotFoundError(f"Ingestion script not found: {_SCRIPT_PATH}")
+
+        # Start subprocess - run as module to support relative imports
+        # Don't capture stdout/stderr - let subprocess write directly to its log file
+        # Capturing causes the process to hang when the pipe buffer fills up
+        _logger.info("Starting ingestion subprocess as module")
+        process = subprocess.Popen(
+            [_PYTHON_EXE, "-m", "ingestor.ingest"],
+            stdout=None,  # Inherit parent's stdout (or redirect to console)
+            stderr=None,  # Inherit parent's stderr
+            cwd=_SRC_DIR,  # Run from src/ directory so module path works
+        )
+        _logger.info(f"Subprocess started with PID: {process.pid}")
+
+    except Exception as exc:
+        _logger.error(f"Exception in start_ingestion(): {exc}", exc_info=True)
+        # Revert state on error
+        with _lock:
             _status = "error"
             _error_message = str(exc)
             _file_operations_locked = False
             _end_time = datetime.now()
 
-            return {
-                "success": False,
-                "message": f"Failed to start ingestion: {exc}",
-                "error": str(exc),
-                "status": get_status()
-            }
+        return {
+            "success": False,
+            "message": f"Failed to start ingestion: {exc}",
+            "error": str(exc),
+            "status": get_status()
+        }
+
+    with _lock:
+        _process = process
+
+    _logger.debug("Preparing return dict")
+    result = {
+        "success": True,
+        "message": "Ingestion started successfully",
+        "process_id": process.pid,
+        "status": get_status()
+    }
+    _logger.info("Returning success from start_ingestion()")
+    return result
 
 
 def stop_ingestion() -> Dict[str, Any]:
@@ -284,18 +310,12 @@ def check_process_status():
         if _status != "running" or not _process:
             return
 
-        # Check if process has finished
+        # Check if process has finished. A non-None poll() means the process
+        # has already been reaped, so no further wait() is needed.
         returncode = _process.poll()
         if returncode is not None:
-            # Process finished - clean it up properly
             _logger.info(f"Ingestion process finished with return code: {returncode}")
 
-            # Ensure process is fully reaped (important on Windows)
-            try:
-                _process.wait(timeout=1)
-            except Exception as wait_exc:
-                _logger.warning(f"Error waiting for process cleanup: {wait_exc}")
-
             _end_time = datetime.now()
             _file_operations_locked = False
 
@@ -305,12 +325,30 @@ def check_process_status():
             else:
                 _status = "error"
                 _error_message = f"Process exited with code {returncode}"
+                log_tail = _read_log_tail(INGESTION_LOG_FILE)
+                if log_tail:
+                    _error_message += f"\n{log_tail}"
                 _logger.error(f"Ingestion failed: {_error_message}")
 
             _process = None
             _logger.debug("Ingestion process cleaned up and status updated")
 
 
+def _read_log_tail(log_file: Path, max_bytes: int = _ERROR_TAIL_BYTES) -> str:
+    """
+    Return the last ``max_bytes`` of a log file, or "" if it cannot be read.
+
+    Only the tail is read (stat + seek), so this stays cheap for large logs.
+    """
+    try:
+        size = log_file.stat().st_size
+        with open(log_file, "rb") as f:
+            f.seek(max(0, size - max_bytes))
+            return f.read().decode("utf-8", errors="replace").strip()
+    except OSError:
+        return ""
+
+
 # --------------------------------------------------------------------------- #
 #  File Operation Locking
 # --------------------------------------------------------------------------- #
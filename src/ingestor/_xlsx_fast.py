@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+lxml fast path for reading the cells of a read-only openpyxl worksheet.
+
+openpyxl's own read-only reader builds a dict per cell, pads every row
+with EmptyCell placeholders and re-wraps the result in ReadOnlyCell
+objects. This module runs ``lxml.etree.iterparse`` directly on the sheet
+XML part, handles the common cell kinds (numbers, shared strings,
+booleans, plain strings, errors) inline and yields only non-empty cells.
+Formulas, inline strings and dates are delegated to openpyxl's
+``WorkSheetParser.parse_cell`` so their values match the regular reader
+exactly.
+
+Importing this module raises ImportError when lxml (or the openpyxl
+internals it relies on) is unavailable; callers fall back to
+``sheet.iter_rows``.
+"""
+
+from typing import Any, Iterator, Optional
+
+from lxml import etree
+from openpyxl.cell.read_only import ReadOnlyCell
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.worksheet._reader import WorkSheetParser, _cast_number
+from openpyxl.xml.constants import SHEET_MAIN_NS
+
+_ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+_CELL_TAG = f"{{{SHEET_MAIN_NS}}}c"
+_VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+_FORMULA_TAG = f"{{{SHEET_MAIN_NS}}}f"
+
+
+def iter_cells(sheet: Any, max_row: Optional[int] = None) -> Iterator[ReadOnlyCell]:
+    """
+    Yield a ReadOnlyCell for every non-empty cell of a read-only worksheet.
+
+    Args:
+        sheet: openpyxl ReadOnlyWorksheet
+        max_row: Stop after this row number (parsing ends early)
+    """
+    wb = sheet.parent
+    shared_strings = sheet._shared_strings
+    date_formats = wb._date_formats
+    data_only = wb.data_only
+
+    with sheet._get_source() as src:
+        parser = WorkSheetParser(
+            src,
+            shared_strings,
+            data_only=data_only,
+            epoch=wb.epoch,
+            date_formats=date_formats,
+            timedelta_formats=wb._timedelta_formats,
+        )
+        parse_cell = parser.parse_cell
+
+        # Row number of the last finished <row>, for files that omit "r"
+        row_counter = 0
+        column = 0
+
+        for _, elem in etree.iterparse(src, events=("end",), tag=(_ROW_TAG, _CELL_TAG)):
+            if elem.tag == _ROW_TAG:
+                r = elem.get("r")
+                row_counter = int(r) if r else row_counter + 1
+                column = 0
+                # Free the finished row and everything parsed before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                if max_row is not None and row_counter >= max_row:
+                    break
+                continue
+
+            data_type = elem.get("t", "n")
+            style = elem.get("s")
+            style_id = int(style) if style else 0
+            coordinate = elem.get("r")
+
+            if coordinate:
+                row, column = coordinate_to_tuple(coordinate)
+            else:
+                r = elem.getparent().get("r")
+                row = int(r) if r else row_counter + 1
+                column += 1
+
+            if max_row is not None and row > max_row:
+                break
+
+            if (data_type == "inlineStr" or data_type == "d"
+                    or (data_type == "n" and style_id in date_formats)
+                    or (not data_only and elem.find(_FORMULA_TAG) is not None)):
+                # Uncommon kinds: let openpyxl convert them
+                parser.row_counter, parser.col_counter = row, column - 1
+                parsed = parse_cell(elem)
+                value = parsed["value"]
+                data_type = parsed["data_type"]
+            else:
+                value = elem.findtext(_VALUE_TAG) or None
+                if value is not None:
+                    if data_type == "n":
+                        value = _cast_number(value)
+                    elif data_type == "s":
+                        value = shared_strings[int(value)]
+                    elif data_type == "b":
+                        value = bool(int(value))
+                    elif data_type == "str":
+                        data_type = "s"
+
+            elem.clear()
+            if value is not None:
+                yield ReadOnlyCell(sheet, row, column, value, data_type, style_id)
@@ -15,12 +15,14 @@ Supported extensions:
 #  Standard‑library imports
 # --------------------------------------------------------------------------- #
 import os
-import pickle
+import queue
 import re
+import threading
+import time
 import warnings
-from datetime import datetime, timezone
+from collections import Counter
 from functools import partial
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count, get_all_start_methods, get_context
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Sequence, Tuple
 
@@ -33,15 +35,17 @@ from logging_config import (
     PerformanceLogger,
     log_system_info,
 )
+from bm25_index import SparseBM25, remove_index, save_index
 
 # --------------------------------------------------------------------------- #
 #  Third‑party imports
 # --------------------------------------------------------------------------- #
 import chromadb
 import fitz  # PyMuPDF
+import numpy as np
 from docx import Document
+from docx.oxml.ns import qn
 from pptx import Presentation
-from rank_bm25 import BM25Okapi
 from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 from transformers import pipeline, AutoModelForTokenClassification, AutoTokenizer
@@ -51,6 +55,7 @@ from transformers import pipeline, AutoModelForTokenClassification, AutoTokenize
 # --------------------------------------------------------------------------- #
 import config
 from .excel_converter import excel_to_json
+from .onnx_embedder import OnnxEmbedder
 
 # --------------------------------------------------------------------------- #
 #  Global configuration & constants
@@ -74,19 +79,50 @@ COLLECTION_NAME = config.VECTOR_DB_COLLECTION_NAME
 
 NUM_WORKERS = min(cpu_count() - 1, 8) or 1
 
+# Extraction workers are recycled after this many tasks, giving back the
+# heap fragmented by large PDFs / workbooks
+WORKER_MAX_TASKS = 16
+
+# Chunks from several files are embedded together once this many are
+# pending, so the model runs a few large encode() calls instead of one
+# small call per file
+EMBED_BATCH = 2048
+
+# First-chunk snippets per NER forward pass
+NER_BATCH_SIZE = 32
+
+# Below this many chunks BM25 tokenization stays in-process (the pool
+# start-up and pickling would cost more than the regex work)
+BM25_PARALLEL_MIN_CHUNKS = 20000
+
+# Rows per collection.add() call (embeddings are converted to lists one
+# slice at a time, which bounds the peak memory of the bulk store)
+CHROMA_ADD_BATCH = 5000
+
+# HNSW parameters, fixed when the collection is created. The space stays L2
+# (Chroma's default): the retriever scores hits as 1 - distance, so changing
+# it would rescale the semantic scores against BM25. More neighbours and a
+# wider build beam raise recall; ef_search is the query-time beam (the
+# retriever asks for at most 50 results).
+HNSW_CONFIG = {
+    "space": "l2",
+    "max_neighbors": 32,
+    "ef_construction": 200,
+    "ef_search": 80,
+}
+
+# Length buckets for encoding: (max prefixed characters, batch size).
+# Batches hold similar-length texts so little padding is computed, and
+# short passages go through in wider batches than long ones.
+EMBED_LENGTH_BUCKETS = (
+    (128, 128),
+    (320, 64),
+    (None, 32),
+)
+
 # Force HuggingFace to stay offline (keeps the original behaviour)
 config.configure_offline_mode()
 
-# Log configuration on module load
-logger.info("Ingestion module loaded with configuration:")
-logger.info(f"  Input folder: {INPUT_FOLDER}")
-logger.info(f"  Vector DB path: {VECTOR_DB_PATH}")
-logger.info(f"  BM25 index path: {BM25_INDEX_PATH}")
-logger.info(f"  Chunk size: {CHUNK_SIZE}, overlap: {CHUNK_OVERLAP}")
-logger.info(f"  Number of workers: {NUM_WORKERS}")
-logger.info(f"  Embedder model: {EMBEDDER_MODEL_PATH}")
-logger.info(f"  NER model: {NER_MODEL_PATH}")
-
 # --------------------------------------------------------------------------- #
 #  Regex patterns used for bilingual metadata extraction
 # --------------------------------------------------------------------------- #
@@ -96,6 +132,11 @@ PATTERNS = {
     "sop": r"\bSOP\b",
     "procedure": r"\b(?:Procedure|إجراء)\b",
 }
+_PAT_COMPILED = {k: re.compile(p, re.IGNORECASE | re.UNICODE) for k, p in PATTERNS.items()}
+
+_ARABIC_RE = re.compile(r"[\u0600-\u06FF]")
+_PARA_RE = re.compile(r"\n\n+|(?<=[.!?؟।])\s+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
 
 
 # --------------------------------------------------------------------------- #
@@ -103,7 +144,11 @@ PATTERNS = {
 # --------------------------------------------------------------------------- #
 def detect_language(text: str) -> str:
     """Very cheap heuristic – Arabic if >50 Arabic chars in the first 500 chars."""
-    arabic = len(re.findall(r"[\u0600-\u06FF]", text[:500]))
+    head = text[:500]
+    # Most pages have no Arabic at all: one C-level search, no match list
+    if _ARABIC_RE.search(head) is None:
+        return "en"
+    arabic = len(_ARABIC_RE.findall(head))
     return "ar" if arabic > 50 else "en"
 
 
@@ -125,23 +170,31 @@ def chunk_text(text: str) -> List[str]:
     """Smart chunker that works for English & Arabic."""
     if not text or len(text) < 50:
         return []
-    chunks, cur = [], ""
-    paragraphs = re.split(r"\n\n+|(?<=[.!?؟।])\s+", text)
+    chunks: List[str] = []
+    # Current chunk as parts + running length (joined only when flushed)
+    cur_parts: List[str] = []
+    cur_len = 0
+    paragraphs = _PARA_RE.split(text)
 
     for para in paragraphs:
         para = para.strip()
         if not para:
             continue
-        if len(cur) + len(para) < CHUNK_SIZE:
-            cur += para + "\n\n"
+        if cur_len + len(para) < CHUNK_SIZE:
+            cur_parts.append(para)
+            cur_parts.append("\n\n")
+            cur_len += len(para) + 2
         else:
-            if cur.strip():
-                chunks.append(cur.strip())
-            overlap = truncate_to_word_boundary(cur, CHUNK_OVERLAP, from_end=True)
-            cur = overlap + para + "\n\n"
-
-    if cur.strip():
-        chunks.append(cur.strip())
+            cur_text = "".join(cur_parts)
+            if cur_text.strip():
+                chunks.append(cur_text.strip())
+            overlap = truncate_to_word_boundary(cur_text, CHUNK_OVERLAP, from_end=True)
+            cur_parts = [overlap, para, "\n\n"]
+            cur_len = len(overlap) + len(para) + 2
+
+    cur_text = "".join(cur_parts).strip()
+    if cur_text:
+        chunks.append(cur_text)
     return chunks if chunks else [text[:CHUNK_SIZE]]
 
 
@@ -154,21 +207,28 @@ def _add_text_page(out: List[Dict], page_num: int, text: str) -> None:
     })
 
 
-def extract_patterns(text: str) -> Dict[str, str]:
-    """Return the first few matches for each regex pattern."""
-    flags = re.IGNORECASE | re.UNICODE
+def extract_patterns(text: str, keys: Sequence[str] | None = None) -> Dict[str, str]:
+    """Return the first few matches for each regex pattern (or only ``keys``)."""
+    patterns = _PAT_COMPILED.items() if keys is None else ((k, _PAT_COMPILED[k]) for k in keys)
     return {
         k: ", ".join(list(set(matches))[:5])
-        for k, p in PATTERNS.items()
-        if (matches := re.findall(p, text, flags))
+        for k, pat in patterns
+        if (matches := pat.findall(text))
     }
 
 
+def pattern_keys(text: str) -> Tuple[str, ...]:
+    """Names of the PATTERNS that occur anywhere in ``text``."""
+    return tuple(k for k, pat in _PAT_COMPILED.items() if pat.search(text))
+
+
 def fs_timestamp_to_iso(ts: float | None) -> str | None:
-    """POSIX → ISO‑8601 (UTC)."""
+    """POSIX → ISO‑8601 (UTC), e.g. ``2024-05-01T08:30:00+00:00``."""
     if ts is None:
         return None
-    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="seconds")
+    # Same string as datetime.fromtimestamp(ts, timezone.utc).isoformat(
+    # timespec="seconds"), without building an aware datetime per call
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(ts))
 
 
 # --------------------------------------------------------------------------- #
@@ -181,7 +241,11 @@ def extract_pdf(pdf_path: Path) -> List[Dict[str, Any]]:
         doc = fitz.open(pdf_path)
         out: List[Dict[str, Any]] = []
         for page_num, page in enumerate(doc, 1):
-            txt = page.get_text()
+            # Text blocks in reading order; block tuples are
+            # (x0, y0, x1, y1, text, block_no, block_type), type 1 = image
+            txt = "\n".join(
+                b[4] for b in page.get_text("blocks") if b[6] == 0 and b[4].strip()
+            )
             if txt.strip():
                 out.append(
                     {"page": page_num, "text": txt, "lang": detect_language(txt)}
@@ -213,12 +277,16 @@ def extract_pdf(pdf_path: Path) -> List[Dict[str, Any]]:
         raise
 
 
+_DOCX_P_TAG = qn("w:p")
+_DOCX_TBL_TAG = qn("w:tbl")
+
+
 def extract_docx(file_path: Path) -> List[Dict[str, Any]]:
     """DOCX → list[{'page','text','lang'}]; tables are separate pages."""
     doc = Document(file_path)
     out: List[Dict[str, Any]] = []
     page_counter = 1
-    buffer = ""
+    buffer: List[str] = []
 
     # Create a mapping of table elements to table objects for lookup
     table_map = {}
@@ -227,12 +295,13 @@ def extract_docx(file_path: Path) -> List[Dict[str, Any]]:
 
     # Process elements in order to preserve document structure
     for element in doc.element.body.iterchildren():
+        tag = element.tag
         # Paragraphs
-        if element.tag.endswith("}p"):
-            txt = element.text or ""
-            buffer += txt + "\n"
+        if tag == _DOCX_P_TAG:
+            buffer.append(element.text or "")
+            buffer.append("\n")
         # Tables
-        elif element.tag.endswith("}tbl"):
+        elif tag == _DOCX_TBL_TAG:
             # Find the corresponding table object
             table_obj = table_map.get(id(element))
             if table_obj:
@@ -243,8 +312,8 @@ def extract_docx(file_path: Path) -> List[Dict[str, Any]]:
                 table_txt = "\n".join(rows)
 
                 if buffer:
-                    _add_text_page(out, page_counter, buffer)
-                    buffer = ""
+                    _add_text_page(out, page_counter, "".join(buffer))
+                    buffer = []
                     page_counter += 1
                 out.append(
                     {"page": page_counter, "text": f"[TABLE]\n{table_txt}", "lang": "table"}
@@ -252,7 +321,7 @@ def extract_docx(file_path: Path) -> List[Dict[str, Any]]:
                 page_counter += 1
 
     if buffer:
-        _add_text_page(out, page_counter, buffer)
+        _add_text_page(out, page_counter, "".join(buffer))
     return out
 
 
@@ -293,7 +362,8 @@ def extract_excel(file_path: Path) -> List[Dict[str, Any]]:
     * ``sheet_title`` is kept for backward‑compatibility with any
       downstream code that expects the original camel‑case name.
     """
-    workbook_dict = excel_to_json(str(file_path), sample_size=None)
+    # Styles are never used for text extraction, so skip them
+    workbook_dict = excel_to_json(str(file_path), sample_size=None, include_styles=False)
     if not workbook_dict:
         return []  # conversion failed – caller will treat as empty
 
@@ -301,17 +371,24 @@ def extract_excel(file_path: Path) -> List[Dict[str, Any]]:
     for sheet_index, sheet in enumerate(workbook_dict.get("sheets", []), start=1):
         # Prefer the explicit title; fall back to a generic one.
         sheet_title = sheet.get("sheetTitle", f"Sheet{sheet_index}")
-        cells = sheet.get("cells", {})
+        cells = sheet.get("cells")
+        if not cells:
+            continue
 
-        # Build a readable text block – one line per cell.
+        # Build a readable text block – one line per cell, ordered by
+        # coordinate. ``cells`` is column-wise (SheetCells), so read the
+        # CellRec fields directly instead of going through Mapping items.
+        coords = list(cells)
+        records = cells.records
         lines: List[str] = []
-        for coord, cell in sorted(cells.items()):
+        for i in sorted(range(len(coords)), key=coords.__getitem__):
+            rec = records[i]
             # Prefer the calculated value if it exists, otherwise raw value.
-            value = cell.get("calculated_value") or cell.get("value")
+            value = rec.calculated_value or rec.value
             if value is None:
                 continue
-            formula = f"  (formula: {cell['formula']})" if "formula" in cell else ""
-            lines.append(f"{coord}: {value}{formula}")
+            formula = f"  (formula: {rec.formula})" if rec.formula is not None else ""
+            lines.append(f"{coords[i]}: {value}{formula}")
 
         sheet_text = "\n".join(lines)
         if not sheet_text:
@@ -354,17 +431,59 @@ def extract_file(file_path: Path) -> List[Dict[str, Any]]:
     return EXTRACTOR_MAP[suffix](file_path)
 
 
+def iter_supported_files(root: Path):
+    """Yield every file under ``root`` with a suffix in EXTRACTOR_MAP (one directory walk)."""
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            # splitext instead of building a Path for every file in the tree
+            if os.path.splitext(name)[1].lower() in EXTRACTOR_MAP:
+                yield Path(dirpath, name)
+
+
 # --------------------------------------------------------------------------- #
 #  Embedding / storage helpers (unchanged)
 # --------------------------------------------------------------------------- #
 def create_embeddings(texts: Sequence[str], model: SentenceTransformer):
+    """
+    Encode passages, returning embeddings in the same order as ``texts``.
+
+    Texts are sorted by length and encoded per EMBED_LENGTH_BUCKETS bucket,
+    then scattered back to their original positions.
+    """
     prefixed = [f"passage: {t[:512]}" for t in texts]
-    return model.encode(
-        prefixed,
-        show_progress_bar=False,
-        batch_size=64,
-        normalize_embeddings=True,
-    )
+    if not prefixed:
+        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    order = sorted(range(len(prefixed)), key=lambda i: len(prefixed[i]))
+    out = None
+    start = 0
+    for max_len, batch_size in EMBED_LENGTH_BUCKETS:
+        end = start
+        while end < len(order) and (max_len is None or len(prefixed[order[end]]) <= max_len):
+            end += 1
+        if end == start:
+            continue
+
+        bucket = order[start:end]
+        emb = model.encode(
+            [prefixed[i] for i in bucket],
+            show_progress_bar=False,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+        )
+        if out is None:
+            out = np.empty((len(prefixed), emb.shape[1]), dtype=emb.dtype)
+        out[bucket] = emb
+        start = end
+    return out
+
+
+def chunk_ids(metadata_list: Sequence[Dict[str, Any]]) -> List[str]:
+    """Chroma ids for one file's chunks: ``<filename>_p<page>_c<index in file>``."""
+    return [
+        f"{meta.get('filename', 'doc')}_p{meta.get('page', 0)}_c{i}"
+        for i, meta in enumerate(metadata_list)
+    ]
 
 
 def store_chromadb(
@@ -372,48 +491,123 @@ def store_chromadb(
         embeddings,
         metadata_list: Sequence[Dict[str, Any]],
         client: chromadb.PersistentClient,
+        ids: Sequence[str] | None = None,
 ):
     collection = client.get_or_create_collection(
         name=COLLECTION_NAME,
+        configuration={"hnsw": HNSW_CONFIG},
         metadata={"description": "Arabic‑English bilingual technical documents"},
     )
-    ids = [
-        f"{meta.get('filename', 'doc')}_p{meta.get('page', 0)}_c{i}"
-        for i, meta in enumerate(metadata_list)
-    ]
+    # Callers batching several files pass ids computed per file
+    if ids is None:
+        ids = chunk_ids(metadata_list)
+
+    documents, metadatas, ids = list(chunks), list(metadata_list), list(ids)
 
-    batch = 100
-    for i in range(0, len(chunks), batch):
-        end = min(i + batch, len(chunks))
+    # One add() per CHROMA_ADD_BATCH rows: each call pays the SQLite
+    # transaction and HNSW lock once
+    for i in range(0, len(documents), CHROMA_ADD_BATCH):
+        end = i + CHROMA_ADD_BATCH
         collection.add(
-            documents=chunks[i:end],
+            documents=documents[i:end],
             embeddings=embeddings[i:end].tolist()
             if hasattr(embeddings, "tolist")
-            else embeddings[i:end],
-            metadatas=metadata_list[i:end],
+            else list(embeddings[i:end]),
+            metadatas=metadatas[i:end],
             ids=ids[i:end],
         )
     return collection
 
 
+def mp_context():
+    """
+    Multiprocessing context for the worker pools.
+
+    Uses forkserver where the platform has it: workers are forked from a
+    small server process that has this module imported but none of the
+    models, instead of from the main process, which holds the embedder and
+    NER weights and runs the embed thread (forking a threaded process is
+    unsafe, and copy-on-write faults would duplicate the weights anyway).
+    """
+    if "forkserver" in get_all_start_methods():
+        ctx = get_context("forkserver")
+        # Pay the heavy imports once in the server, not in every worker
+        ctx.set_forkserver_preload(["ingestor.ingest"])
+        return ctx
+    return get_context()
+
+
+def _tokenize_batch(texts: Sequence[str]) -> List[List[str]]:
+    return [_WORD_RE.findall(t.lower()) for t in texts]
+
+
+def tokenize_corpus(chunks: Sequence[str]) -> List[List[str]]:
+    """BM25 tokens per chunk; large corpora are sharded across NUM_WORKERS processes."""
+    if NUM_WORKERS < 2 or len(chunks) < BM25_PARALLEL_MIN_CHUNKS:
+        return _tokenize_batch(chunks)
+    step = -(-len(chunks) // NUM_WORKERS)
+    shards = [chunks[i:i + step] for i in range(0, len(chunks), step)]
+    with mp_context().Pool(processes=NUM_WORKERS) as pool:
+        return [tokens for shard in pool.map(_tokenize_batch, shards) for tokens in shard]
+
+
 def build_bm25(chunks: Sequence[str], metadatas: Sequence[Dict[str, Any]]):
-    tokenized = [re.findall(r"\w+", c.lower()) for c in chunks]
-    bm25 = BM25Okapi(tokenized)
-    with open(BM25_INDEX_PATH, "wb") as f:
-        pickle.dump({"bm25": bm25, "chunks": chunks, "metadatas": metadatas}, f)
+    tokenized = tokenize_corpus(chunks)
+    bm25 = SparseBM25(tokenized)
+    save_index(BM25_INDEX_PATH, bm25, chunks, metadatas)
     return bm25
 
 
 # --------------------------------------------------------------------------- #
 #  Worker that runs in a separate process (extract → chunk → meta)
 # --------------------------------------------------------------------------- #
+def load_ner(model_path: str):
+    """Build the token-classification pipeline used for persons/orgs metadata."""
+    return pipeline(
+        "ner",
+        model=AutoModelForTokenClassification.from_pretrained(model_path, local_files_only=True),
+        tokenizer=AutoTokenizer.from_pretrained(
+            model_path, local_files_only=True, clean_up_tokenization_spaces=True
+        ),
+        device=-1,  # CPU
+        aggregation_strategy="simple",
+    )
+
+
+def apply_ner(ner: Any, chunks: Sequence[str], metadatas: Sequence[Dict[str, Any]]) -> None:
+    """
+    Add ``persons``/``orgs`` metadata to the first chunk of every page.
+
+    All eligible snippets are run through the pipeline in one batched call.
+    """
+    targets = [
+        i for i, (chunk, meta) in enumerate(zip(chunks, metadatas))
+        if meta["chunk"] == 0 and len(chunk) > 100
+    ]
+    if not targets:
+        return
+    try:
+        results = ner([chunks[i][:500] for i in targets], batch_size=NER_BATCH_SIZE)
+    except Exception as exc:
+        # NER errors should never abort the pipeline
+        log_exception(logger, exc, f"NER over {len(targets)} snippets")
+        return
+
+    for i, ents in zip(targets, results):
+        for entity_type, key in [("PER", "persons"), ("ORG", "orgs")]:
+            entities = [e["word"] for e in ents if entity_type in e["entity_group"]]
+            if entities:
+                metadatas[i][key] = ", ".join(list(set(entities))[:3])
+
+
 def extract_and_chunk_file(
         file_path: Path,
-        ner: Any = None,
         input_folder: Path = None,
 ) -> Tuple[str, List[str], List[Dict[str, Any]]] | None:
     """
     Returns (filename, list_of_chunks, list_of_metadatas) or None on failure.
+
+    NER metadata is added later, in batches, by ``apply_ner``.
     """
     try:
         # Compute relative path from input folder (or use basename if not provided)
@@ -427,9 +621,10 @@ def extract_and_chunk_file(
         else:
             filename = file_path.name
 
-        created_iso = fs_timestamp_to_iso(os.path.getctime(file_path))
-        modified_iso = fs_timestamp_to_iso(os.path.getmtime(file_path))
-        file_size = file_path.stat().st_size  # Get file size in bytes
+        st = os.stat(file_path)  # one syscall for both timestamps and the size
+        created_iso = fs_timestamp_to_iso(st.st_ctime)
+        modified_iso = fs_timestamp_to_iso(st.st_mtime)
+        file_size = st.st_size  # Get file size in bytes
 
         # --------------------------------------------------------------- #
         #  1️⃣  Extract raw pages (text + optional tables/formulas)
@@ -444,35 +639,33 @@ def extract_and_chunk_file(
         # --------------------------------------------------------------- #
         #  2️⃣  Chunk & enrich metadata
         # --------------------------------------------------------------- #
+        file_type = file_path.suffix.lower().lstrip(".")
         all_chunks, all_meta = [], []
         for page in pages:
             chunks = chunk_text(page["text"])
+            if not chunks:
+                continue
+
+            # Page-level scans, shared by every (overlapping) chunk of the page:
+            # a chunk can only match patterns that occur somewhere on its page
+            page_keys = pattern_keys(page["text"])
+            page_lang = page.get("lang", "unknown")
+            page_extra = {k: page[k] for k in ("sheet_title", "total_cells") if k in page}
+
             for idx, chunk in enumerate(chunks):
                 meta = {
-                    **extract_patterns(chunk),
+                    **(extract_patterns(chunk, page_keys) if page_keys else {}),
                     "filename": filename,
                     "page": page["page"],
                     "total_pages": total_pages,
                     "chunk": idx,
-                    "lang": page.get("lang", "unknown"),
+                    "lang": page_lang,
                     "created_at": created_iso,
                     "modified_at": modified_iso,
                     "file_size": file_size,
-                    "file_type": file_path.suffix.lower().lstrip("."),
-                    **{k: page[k] for k in ("sheet_title", "total_cells") if k in page}
+                    "file_type": file_type,
+                    **page_extra,
                 }
-
-                # ---- optional NER (first chunk of each page) ---- #
-                if ner and idx == 0 and len(chunk) > 100:
-                    try:
-                        ents = ner(chunk[:500], aggregation_strategy="simple")
-                        for entity_type, key in [("PER", "persons"), ("ORG", "orgs")]:
-                            entities = [e["word"] for e in ents if entity_type in e["entity_group"]]
-                            if entities:
-                                meta[key] = ", ".join(set(entities)[:3])
-                    except Exception:
-                        pass  # NER errors should never abort the pipeline
-
                 all_chunks.append(chunk)
                 all_meta.append(meta)
 
@@ -493,18 +686,24 @@ def main() -> None:
     logger.info("Document Ingestion Process Starting")
     logger.info("=" * 80)
     log_system_info(logger)
+    # Logged here, not on import: pool workers re-import this module
+    logger.info("Ingestion configuration:")
+    logger.info(f"  Input folder: {INPUT_FOLDER}")
+    logger.info(f"  Vector DB path: {VECTOR_DB_PATH}")
+    logger.info(f"  BM25 index path: {BM25_INDEX_PATH}")
+    logger.info(f"  Chunk size: {CHUNK_SIZE}, overlap: {CHUNK_OVERLAP}")
+    logger.info(f"  Number of workers: {NUM_WORKERS}")
+    logger.info(f"  Embedder model: {EMBEDDER_MODEL_PATH}")
+    logger.info(f"  NER model: {NER_MODEL_PATH}")
 
     with PerformanceLogger(logger, "Complete ingestion process"):
         # --------------------------------------------------------------- #
         #  1️⃣  Find *all* supported documents
         # --------------------------------------------------------------- #
         logger.info(f"Scanning for documents in: {INPUT_FOLDER}")
-        all_files: List[Path] = []
-        for suffix in EXTRACTOR_MAP.keys():
-            files = list(Path(INPUT_FOLDER).rglob(f"*{suffix}"))
-            if files:
-                logger.info(f"Found {len(files)} {suffix} file(s)")
-            all_files.extend(files)
+        all_files: List[Path] = list(iter_supported_files(INPUT_FOLDER))
+        for suffix, count in Counter(f.suffix.lower() for f in all_files).items():
+            logger.info(f"Found {count} {suffix} file(s)")
 
         if not all_files:
             logger.warning("No supported documents found - exiting")
@@ -513,17 +712,25 @@ def main() -> None:
 
         logger.info(f"Total files to process: {len(all_files)}")
 
+        # Largest files first: a long PDF that starts last would keep one
+        # worker busy long after the others have drained the queue
+        all_files.sort(key=lambda f: f.stat().st_size, reverse=True)
+
         # --------------------------------------------------------------- #
         #  2️⃣  Load heavy models once (in the main process)
         # --------------------------------------------------------------- #
         logger.info("Loading embedding model...")
         with PerformanceLogger(logger, "Loading embedder model"):
-            embedder = SentenceTransformer(
-                str(EMBEDDER_MODEL_PATH),
-                device="cpu",
-                local_files_only=True,
-                tokenizer_kwargs={"clean_up_tokenization_spaces": True, "fix_mistral_regex": True},
-            )
+            if config.EMBEDDER_BACKEND == "onnx-int8":
+                logger.info("Using ONNX Runtime INT8 embedder")
+                embedder = OnnxEmbedder(EMBEDDER_MODEL_PATH)
+            else:
+                embedder = SentenceTransformer(
+                    str(EMBEDDER_MODEL_PATH),
+                    device="cpu",
+                    local_files_only=True,
+                    tokenizer_kwargs={"clean_up_tokenization_spaces": True, "fix_mistral_regex": True},
+                )
         logger.info("Embedding model loaded successfully")
 
         logger.info("Initializing ChromaDB client...")
@@ -543,8 +750,7 @@ def main() -> None:
         # Clear BM25 index file
         logger.info("Clearing existing BM25 index...")
         try:
-            if BM25_INDEX_PATH.exists():
-                BM25_INDEX_PATH.unlink()
+            if remove_index(BM25_INDEX_PATH):
                 logger.info(f"Successfully deleted old BM25 index: {BM25_INDEX_PATH}")
             else:
                 logger.info("No existing BM25 index to delete (this is normal for first run)")
@@ -553,75 +759,144 @@ def main() -> None:
 
         logger.info("ChromaDB and BM25 index are now synced with filesystem - ready for fresh ingestion")
 
+        # NER runs batched in the main process (see apply_ner), so the
+        # workers never load or receive the model
         logger.info("Loading NER model...")
         with PerformanceLogger(logger, "Loading NER model"):
-            ner_pipe = pipeline(
-                "ner",
-                model=AutoModelForTokenClassification.from_pretrained(
-                    str(NER_MODEL_PATH), local_files_only=True
-                ),
-                tokenizer=AutoTokenizer.from_pretrained(
-                    str(NER_MODEL_PATH), local_files_only=True, clean_up_tokenization_spaces=True
-                ),
-                device=-1,  # CPU
-                aggregation_strategy="simple",
-            )
+            ner_pipe = load_ner(str(NER_MODEL_PATH))
         logger.info("NER model loaded successfully")
 
-        worker = partial(extract_and_chunk_file, ner=ner_pipe, input_folder=Path(INPUT_FOLDER))
+        worker = partial(extract_and_chunk_file, input_folder=Path(INPUT_FOLDER))
 
         # --------------------------------------------------------------- #
         #  3️⃣  Parallel extraction / chunking (CPU bound)
         # --------------------------------------------------------------- #
-        logger.info(f"Starting parallel processing with {NUM_WORKERS} workers")
-        total_chunks = processed = failed = 0
+        # One file per task: the files are sorted largest first, and larger
+        # chunks would hand the biggest ones to a single worker together
+        chunksize = 1
+        logger.info(f"Starting parallel processing with {NUM_WORKERS} workers (chunksize={chunksize})")
+        total_chunks = processed = failed = store_failed = 0
+
+        # Extracted files are handed to a background thread that embeds
+        # them, so the pool keeps extracting while the model runs (torch
+        # releases the GIL during encode). The bound keeps memory flat if
+        # extraction outpaces embedding.
+        embed_queue: "queue.Queue[Tuple[str, List[str], List[Dict[str, Any]]] | None]" = queue.Queue(maxsize=8)
+
+        # Cross-file embedding buffer, flushed every EMBED_BATCH chunks
+        # (owned by the embed thread)
+        pending_chunks: List[str] = []
+        pending_meta: List[Dict[str, Any]] = []
+        pending_ids: List[str] = []
+        pending_files: List[str] = []
+
+        # Embedded corpus, written to Chroma in one bulk pass after the pool
+        # has drained instead of one incremental HNSW insert per batch
+        all_embs: List[np.ndarray] = []
+        all_docs: List[str] = []
+        all_meta: List[Dict[str, Any]] = []
+        all_ids: List[str] = []
+        embedded_files = 0
+
+        def flush_pending() -> None:
+            nonlocal embedded_files, store_failed
+            if not pending_chunks:
+                return
+            try:
+                with PerformanceLogger(
+                        logger, f"Embedding {len(pending_chunks)} chunks "
+                                f"from {len(pending_files)} file(s)"
+                ):
+                    apply_ner(ner_pipe, pending_chunks, pending_meta)
+                    embeddings = create_embeddings(pending_chunks, embedder)
+                all_embs.append(embeddings)
+                all_docs.extend(pending_chunks)
+                all_meta.extend(pending_meta)
+                all_ids.extend(pending_ids)
+                embedded_files += len(pending_files)
+                logger.debug(f"Embedded {len(pending_chunks)} chunks for {', '.join(pending_files)}")
+            except Exception as exc:
+                tqdm.write(f"❌  Embedding error for {len(pending_files)} file(s): {exc}")
+                log_exception(logger, exc, f"embedding {', '.join(pending_files)}")
+                store_failed += len(pending_files)
+            pending_chunks.clear()
+            pending_meta.clear()
+            pending_ids.clear()
+            pending_files.clear()
+
+        def embed_and_store() -> None:
+            while (item := embed_queue.get()) is not None:
+                filename, chunks, metadata = item
+                pending_chunks.extend(chunks)
+                pending_meta.extend(metadata)
+                pending_ids.extend(chunk_ids(metadata))
+                pending_files.append(filename)
+                if len(pending_chunks) >= EMBED_BATCH:
+                    flush_pending()
+            # Embed whatever is left once the pool is drained
+            flush_pending()
 
         with PerformanceLogger(logger, "Parallel file processing"):
-            with Pool(processes=NUM_WORKERS) as pool, tqdm(
+            with mp_context().Pool(
+                    processes=NUM_WORKERS,
+                    maxtasksperchild=WORKER_MAX_TASKS,
+            ) as pool, tqdm(
                     total=len(all_files), desc="Processing files", unit="file"
             ) as pbar:
-                for result in pool.imap_unordered(worker, all_files):
-                    if result is None:
-                        failed += 1
-                        pbar.update(1)
-                        continue
-
-                    filename, chunks, metadata = result
-                    processed += 1
-                    logger.debug(f"Successfully processed: {filename} ({len(chunks)} chunks)")
-
-                    if chunks:
-                        try:
-                            with PerformanceLogger(logger, f"Embedding and storing {filename}"):
-                                embeddings = create_embeddings(chunks, embedder)
-                                store_chromadb(chunks, embeddings, metadata, client)
-                                total_chunks += len(chunks)
-                            logger.debug(f"Stored {len(chunks)} chunks for {filename}")
-                        except Exception as exc:
-                            tqdm.write(f"❌  Storing error for {filename}: {exc}")
-                            log_exception(logger, exc, f"storing {filename}")
+                embed_thread = threading.Thread(target=embed_and_store, name="embed-store", daemon=True)
+                embed_thread.start()
+                try:
+                    for result in pool.imap_unordered(worker, all_files, chunksize=chunksize):
+                        if result is None:
                             failed += 1
+                            pbar.update(1)
+                            continue
 
-                    pbar.update(1)
-                    pbar.set_postfix(
-                        {"processed": processed, "failed": failed, "chunks": total_chunks}
-                    )
+                        filename, chunks, metadata = result
+                        processed += 1
+                        logger.debug(f"Successfully processed: {filename} ({len(chunks)} chunks)")
+
+                        if chunks:
+                            embed_queue.put((filename, chunks, metadata))
+
+                        pbar.update(1)
+                        pbar.set_postfix(
+                            {"processed": processed, "failed": failed + store_failed, "chunks": len(all_docs)}
+                        )
+                    # Let the workers exit on their own so their log records
+                    # are flushed (the with block would terminate() them)
+                    pool.close()
+                    pool.join()
+                finally:
+                    embed_queue.put(None)
+                    embed_thread.join()
+
+        failed += store_failed
+
+        # --------------------------------------------------------------- #
+        #  4️⃣  Bulk-store the embedded corpus in Chroma
+        # --------------------------------------------------------------- #
+        if all_docs:
+            try:
+                with PerformanceLogger(logger, f"Storing {len(all_docs)} chunks in ChromaDB"):
+                    store_chromadb(all_docs, np.concatenate(all_embs), all_meta, client, ids=all_ids)
+                total_chunks = len(all_docs)
+            except Exception as exc:
+                tqdm.write(f"❌  Storing error for {embedded_files} file(s): {exc}")
+                log_exception(logger, exc, "storing chunks in ChromaDB")
+                failed += embedded_files
+            all_embs.clear()
 
         logger.info(f"File processing complete: {processed} processed, {failed} failed")
 
         # --------------------------------------------------------------- #
-        #  4️⃣  Build BM25 index from everything that landed in Chroma
+        #  5️⃣  Build BM25 index from the same chunks that landed in Chroma
         # --------------------------------------------------------------- #
         if total_chunks:
             logger.info("Building BM25 index...")
             with PerformanceLogger(logger, "Building BM25 index"):
-                collection = client.get_collection(COLLECTION_NAME)
-                docs = collection.get()
-                if docs and docs["documents"]:
-                    build_bm25(docs["documents"], docs["metadatas"])
-                    logger.info(f"BM25 index built with {len(docs['documents'])} documents")
-                else:
-                    logger.warning("No documents found in ChromaDB collection")
+                build_bm25(all_docs, all_meta)
+            logger.info(f"BM25 index built with {len(all_docs)} documents")
         else:
             logger.warning("No chunks to index - skipping BM25 build")
 
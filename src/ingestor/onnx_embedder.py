@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+INT8 ONNX Runtime replacement for the SentenceTransformer embedder.
+
+On first use the transformer under ``model_path`` is exported to ONNX and
+its MatMul weights are dynamically quantized to INT8; both files are kept
+in ``<model_path>/onnx`` so later runs load the quantized graph directly.
+``OnnxEmbedder.encode`` reproduces the sentence-transformers pipeline used
+for the e5 models (mean pooling over the attention mask, optional L2
+normalization), so it is a drop-in replacement for ``create_embeddings``.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+import onnxruntime as ort
+from transformers import AutoConfig, AutoTokenizer
+
+ONNX_SUBDIR = "onnx"
+FP32_FILENAME = "model.onnx"
+INT8_FILENAME = "model_int8.onnx"
+
+MAX_SEQ_LENGTH = 512
+
+
+def _graph_loads(path: Path) -> bool:
+    """
+    Whether the ONNX graph at ``path`` exists and passes the ONNX checker.
+
+    The checker is given the path, not a loaded model, so graphs over 2 GB
+    work and every external-data file the graph refers to must be present.
+    """
+    import onnx
+
+    if not path.exists():
+        return False
+    try:
+        onnx.checker.check_model(str(path))
+    except Exception:
+        return False
+    return True
+
+
+def _publish(scratch: Path, onnx_dir: Path, graph_name: str) -> Path:
+    """
+    Move every file in ``scratch`` into ``onnx_dir``, the graph ``graph_name`` last.
+
+    The external-data files go first because the graph refers to them by
+    name; the graph itself marks a finished export.
+    """
+    for file in scratch.iterdir():
+        if file.name != graph_name:
+            os.replace(file, onnx_dir / file.name)
+    graph = onnx_dir / graph_name
+    os.replace(scratch / graph_name, graph)
+    return graph
+
+
+def _export_int8(model_path: Path, onnx_dir: Path) -> Path:
+    """
+    Export the model to ONNX and write a dynamically quantized INT8 copy.
+
+    Args:
+        model_path: Directory of the HuggingFace model
+        onnx_dir: Directory receiving the FP32 and INT8 graphs
+
+    Returns:
+        Path of the INT8 model
+    """
+    # Export-only dependencies
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModel
+
+    onnx_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = onnx_dir / FP32_FILENAME
+
+    # Each graph is written to a scratch directory, with any external-data
+    # files, and moved into place once complete, so an interrupted export is
+    # redone instead of reused
+    if not _graph_loads(fp32_path):
+        with tempfile.TemporaryDirectory(dir=onnx_dir) as scratch:
+            scratch = Path(scratch)
+            model = AutoModel.from_pretrained(str(model_path), local_files_only=True)
+            model.eval()
+            dummy = {
+                "input_ids": torch.ones((1, 8), dtype=torch.long),
+                "attention_mask": torch.ones((1, 8), dtype=torch.long),
+            }
+            with torch.no_grad():
+                # TorchScript exporter: the dynamo one needs onnxscript.
+                # Models over protobuf's 2 GB limit (multilingual-e5-large
+                # in FP32) get one external-data file per initializer.
+                torch.onnx.export(
+                    model,
+                    (dummy,),
+                    str(scratch / FP32_FILENAME),
+                    input_names=["input_ids", "attention_mask"],
+                    output_names=["last_hidden_state"],
+                    dynamic_axes={
+                        "input_ids": {0: "batch", 1: "sequence"},
+                        "attention_mask": {0: "batch", 1: "sequence"},
+                        "last_hidden_state": {0: "batch", 1: "sequence"},
+                    },
+                    opset_version=17,
+                    dynamo=False,
+                )
+            del model
+            if not _graph_loads(scratch / FP32_FILENAME):
+                raise RuntimeError(f"ONNX export of {model_path} produced an invalid graph")
+            _publish(scratch, onnx_dir, FP32_FILENAME)
+
+    with tempfile.TemporaryDirectory(dir=onnx_dir) as scratch:
+        scratch = Path(scratch)
+        quantize_dynamic(
+            str(fp32_path),
+            str(scratch / INT8_FILENAME),
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["MatMul"],
+            use_external_data_format=True,
+        )
+        return _publish(scratch, onnx_dir, INT8_FILENAME)
+
+
+class OnnxEmbedder:
+    """
+    Sentence embedder running an INT8-quantized transformer on ONNX Runtime.
+
+    Parameters
+    ----------
+    model_path : Path
+        Directory of the HuggingFace model (tokenizer, config, weights).
+    onnx_dir : Path, optional
+        Where the exported graphs live; defaults to ``model_path / "onnx"``.
+    num_threads : int, optional
+        Intra-op thread count for ONNX Runtime (0 lets it decide).
+    """
+
+    def __init__(self, model_path: Path, onnx_dir: Optional[Path] = None, num_threads: int = 0):
+        model_path = Path(model_path)
+        onnx_dir = Path(onnx_dir) if onnx_dir else model_path / ONNX_SUBDIR
+
+        int8_path = onnx_dir / INT8_FILENAME
+        if not int8_path.exists():
+            int8_path = _export_int8(model_path, onnx_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            str(model_path),
+            local_files_only=True,
+            clean_up_tokenization_spaces=True,
+        )
+        self.dimension = AutoConfig.from_pretrained(str(model_path), local_files_only=True).hidden_size
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            str(int8_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(
+        self,
+        sentences: Sequence[str],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """
+        Embed ``sentences`` with mean pooling, like SentenceTransformer.encode.
+
+        Returns
+        -------
+        np.ndarray
+            ``(len(sentences), dimension)`` float32 array.
+        """
+        batches: List[np.ndarray] = []
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(
+                list(sentences[start:start + batch_size]),
+                padding=True,
+                truncation=True,
+                max_length=MAX_SEQ_LENGTH,
+                return_tensors="np",
+            )
+            feed = {name: tokens[name].astype(np.int64) for name in self._input_names}
+            hidden = self.session.run(None, feed)[0]
+
+            mask = tokens["attention_mask"][..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            batches.append(pooled.astype(np.float32, copy=False))
+
+        if not batches:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.concatenate(batches)
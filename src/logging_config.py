@@ -10,21 +10,39 @@ This module provides a comprehensive logging setup with:
 - Console output for immediate feedback
 - Structured formatting with timestamps and context
 - Automatic error detection and tracking
+- Queued output: loggers only enqueue records, a background listener
+  thread does the formatting and file/console writes
 """
 
+import atexit
+import functools
 import logging
+import os
+import platform
+import queue
+import stat
 import sys
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing import util as mp_util
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
+# None of the formats below use thread, process or task names, so skip
+# collecting them for every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
 
 # --------------------------------------------------------------------------- #
 #  Configuration Constants
 # --------------------------------------------------------------------------- #
 LOG_DIR = Path(__file__).parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
 # Log file paths
 APP_LOG_FILE = LOG_DIR / "app.log"
@@ -35,20 +53,442 @@ INGESTION_LOG_FILE = LOG_DIR / "ingestion.log"
 MAX_BYTES = 10 * 1024 * 1024  # 10 MB per file
 BACKUP_COUNT = 5  # Keep 5 backup files
 
-# Log format with detailed context
+# Buffered log files: write buffer size and the longest time a record may
+# sit in it (ERROR and above are flushed immediately)
+FILE_BUFFER_SIZE = 64 * 1024
+FLUSH_INTERVAL = 2.0  # seconds
+
+# Most records the listener takes off the queue in one go
+LISTENER_BATCH_SIZE = 64
+
+# Log format with detailed context (error log only: the caller's file,
+# line and function are the costly part of a record)
 DETAILED_FORMAT = (
     "%(asctime)s | %(levelname)-8s | %(name)-30s | "
     "%(filename)s:%(lineno)-4d | %(funcName)-25s | %(message)s"
 )
 
+# Format of the high-volume app and ingestion logs
+HOT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)-30s | %(message)s"
+
 SIMPLE_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
 
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
+class FastFormatter(logging.Formatter):
+    """
+    Formatter that renders each second's timestamp only once.
+
+    ``%(asctime)s`` has one-second resolution, so the strftime result is
+    cached and reused for every record created within the same second.
+    Milliseconds are never appended.
+    """
+
+    default_msec_format = ""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, rendered string), replaced as a unit
+        self._cached_time: Tuple[Optional[int], str] = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        cached_sec, cached = self._cached_time
+        if sec != cached_sec:
+            cached = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            self._cached_time = (sec, cached)
+        return cached
+
+
+# The only formatters; shared by every handler (all formatting happens on
+# the listener thread)
+_DETAILED_FORMATTER = FastFormatter(DETAILED_FORMAT, datefmt=DATE_FORMAT)
+_HOT_FORMATTER = FastFormatter(HOT_FORMAT, datefmt=DATE_FORMAT)
+_SIMPLE_FORMATTER = FastFormatter(SIMPLE_FORMAT, datefmt=DATE_FORMAT)
+
+
+# --------------------------------------------------------------------------- #
+#  Buffered File Output
+# --------------------------------------------------------------------------- #
+# Every buffered handler, so the listener can flush them when it goes idle
+_BUFFERED_HANDLERS: "weakref.WeakSet[BufferedRotatingFileHandler]" = weakref.WeakSet()
+
+# Single worker that shifts rotated backups off the write path (recreated
+# in forked children, which do not inherit its thread)
+_ROTATION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_ROTATION_PID: Optional[int] = None
+
+
+def _rotation_executor() -> ThreadPoolExecutor:
+    global _ROTATION_EXECUTOR, _ROTATION_PID
+    if _ROTATION_EXECUTOR is None or _ROTATION_PID != os.getpid():
+        _ROTATION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotation")
+        _ROTATION_PID = os.getpid()
+    return _ROTATION_EXECUTOR
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that does not flush after every record.
+
+    The file is opened with a FILE_BUFFER_SIZE write buffer and flushed when
+    an ERROR (or worse) record is written, when FLUSH_INTERVAL has passed
+    since the last flush, or when the queue listener has been idle for
+    FLUSH_INTERVAL.
+
+    Rollover only renames the full file to a pending name and opens a new
+    one; shifting the ``.1`` .. ``.N`` backups and moving the pending file
+    to ``.1`` happens on a background worker, so writing resumes at once.
+
+    The size check uses a byte counter kept by ``emit`` (seeded from the
+    file size on open) instead of ``stream.tell()``, which would flush the
+    write buffer on every record.
+
+    The file is a binary ``O_APPEND`` stream: records are encoded once and
+    written as bytes, with no text layer, and appends from several
+    processes sharing the file never overwrite each other.
+    """
+
+    def __init__(self, *args, flush_interval: float = FLUSH_INTERVAL, **kwargs):
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._rollover_seq = 0
+        self._written_bytes = 0
+        self._regular_file = True
+        super().__init__(*args, **kwargs)
+        _BUFFERED_HANDLERS.add(self)
+
+    def doRollover(self) -> None:
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        self._rollover_seq += 1
+        pending = f"{self.baseFilename}.rollover-{os.getpid()}-{self._rollover_seq}"
+        try:
+            os.replace(self.baseFilename, pending)
+        except FileNotFoundError:
+            pending = None
+
+        self.stream = self._open()
+        if pending is not None:
+            # One worker: rollovers are applied in order
+            _rotation_executor().submit(self._shift_backups, pending)
+
+    def _shift_backups(self, pending: str) -> None:
+        """Shift ``.1`` .. ``.N-1`` up by one and move ``pending`` to ``.1``."""
+        try:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(sfn):
+                    os.replace(sfn, dfn)
+            self.rotate(pending, self.rotation_filename(f"{self.baseFilename}.1"))
+        except OSError:
+            # Cannot log through logging from here; report like handleError
+            traceback.print_exc(file=sys.stderr)
+
+    def _open(self):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+        if "w" in self.mode:
+            flags |= os.O_TRUNC
+        fd = os.open(self.baseFilename, flags, 0o644)
+        stream = os.fdopen(fd, "ab", buffering=FILE_BUFFER_SIZE)
+        st = os.fstat(fd)
+        self._written_bytes = st.st_size
+        # Never rotate /dev/null or other special files (like the stdlib)
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        return (self.format(record) + self.terminator).encode(
+            self.encoding or "utf-8", self.errors or "strict"
+        )
+
+    def _needs_rollover(self, size: int) -> bool:
+        # An empty file is never rolled over, even for an oversized record
+        return (
+            self.maxBytes > 0
+            and self._regular_file
+            and self._written_bytes > 0
+            and self._written_bytes + size >= self.maxBytes
+        )
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return self._needs_rollover(len(self._encode(record)))
+
+    def handle_batch(self, records: Sequence[logging.LogRecord], rendered: Dict[tuple, bytes]) -> None:
+        """
+        Write several records with one write call per file.
+
+        ``rendered`` maps ``(id(record), id(formatter), encoding)`` to the
+        encoded message; it is shared across the handlers of one listener
+        batch so a record sent to several files with the same formatter is
+        only formatted and encoded once.
+        """
+        parts = []
+        urgent = False
+        with self.lock:
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                for record in records:
+                    if record.levelno < self.level or not self.filter(record):
+                        continue
+                    key = (id(record), id(self.formatter), self.encoding)
+                    try:
+                        msg = rendered.get(key)
+                        if msg is None:
+                            msg = rendered[key] = self._encode(record)
+                    except Exception:
+                        self.handleError(record)
+                        continue
+                    size = len(msg)
+                    if self._needs_rollover(size):
+                        self.stream.write(b"".join(parts))
+                        parts = []
+                        self.doRollover()
+                    parts.append(msg)
+                    self._written_bytes += size
+                    urgent = urgent or record.levelno >= logging.ERROR
+                if parts:
+                    self.stream.write(b"".join(parts))
+
+                now = time.monotonic()
+                if urgent or now - self._last_flush >= self.flush_interval:
+                    self.flush()
+                    self._last_flush = now
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(records[-1])
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self._encode(record)
+            size = len(msg)
+            if self._needs_rollover(size):
+                self.doRollover()
+            self.stream.write(msg)
+            self._written_bytes += size
+
+            now = time.monotonic()
+            if record.levelno >= logging.ERROR or now - self._last_flush >= self.flush_interval:
+                self.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_buffered() -> None:
+    """Flush every buffered file handler."""
+    for handler in list(_BUFFERED_HANDLERS):
+        handler.flush()
+        handler._last_flush = time.monotonic()
+
+
+# --------------------------------------------------------------------------- #
+#  Queued Output
+# --------------------------------------------------------------------------- #
+class _RoutingQueueHandler(QueueHandler):
+    """QueueHandler that tags each record with the (handler, level) pairs it must reach."""
+
+    def __init__(self, log_queue: queue.SimpleQueue, targets: Sequence[Tuple[logging.Handler, int]]):
+        super().__init__(log_queue)
+        self.targets = tuple(targets)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # The module-level queue, not self.queue: forked children replace it
+        _LOG_QUEUE.put_nowait((self.targets, record))
+
+
+class _RoutingQueueListener(QueueListener):
+    """
+    QueueListener that delivers each record to the handlers it was tagged with.
+
+    Records are taken off the queue in batches of up to LISTENER_BATCH_SIZE
+    (whatever is already waiting; it never holds a record back). Each
+    buffered file then gets its share of the batch in a single write, and a
+    record going to several files is formatted once per formatter.
+    """
+
+    def _monitor(self) -> None:
+        q = self.queue
+        while True:
+            item = self.dequeue(True)
+            if item is self._sentinel:
+                break
+            batch = [item]
+            stop = False
+            while len(batch) < LISTENER_BATCH_SIZE:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._sentinel:
+                    stop = True
+                    break
+                batch.append(item)
+            self.handle_batch(batch)
+            if stop:
+                break
+
+    def handle_batch(self, batch) -> None:
+        per_handler: Dict[logging.Handler, list] = {}
+        for targets, record in batch:
+            for handler, level in targets:
+                if record.levelno >= level:
+                    per_handler.setdefault(handler, []).append(record)
+
+        rendered: Dict[tuple, bytes] = {}
+        for handler, records in per_handler.items():
+            if isinstance(handler, BufferedRotatingFileHandler):
+                handler.handle_batch(records, rendered)
+            else:
+                for record in records:
+                    handler.handle(record)
+
+    def dequeue(self, block: bool):
+        # Wake up every FLUSH_INTERVAL while idle to flush buffered files
+        while True:
+            try:
+                return self.queue.get(block, timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                _flush_buffered()
+
+    def handle(self, item) -> None:
+        targets, record = item
+        for handler, level in targets:
+            if record.levelno >= level:
+                handler.handle(record)
+
+
+# One queue and one listener thread shared by every configured logger
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_LISTENER: Optional[_RoutingQueueListener] = None
+
+
+def _start_listener() -> None:
+    """Start the listener thread once per process."""
+    global _LISTENER
+    if _LISTENER is None:
+        _LISTENER = _RoutingQueueListener(_LOG_QUEUE)
+        _LISTENER.start()
+        # Registered after logging's own atexit hook, so it runs first:
+        # pending records are written before the handlers are closed
+        atexit.register(_stop_listener)
+        # multiprocessing children (pool workers) leave through os._exit,
+        # which skips atexit; their finalizers still run on a normal exit.
+        # A child clears the finalizers it inherits right after the fork,
+        # so the listener started by the fork hook registers again then.
+        _register_finalizer(_LISTENER)
+        mp_util.register_after_fork(_LISTENER, _register_finalizer)
+
+
+def _register_finalizer(_listener: QueueListener) -> None:
+    mp_util.Finalize(None, _stop_listener, exitpriority=0)
+
+
+def _stop_listener() -> None:
+    """Drain the queue, stop the listener thread and flush buffered files."""
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+        _flush_buffered()
+
+
+def _restart_listener_in_child() -> None:
+    """
+    Fork hook: threads do not survive fork, so start a fresh listener.
+
+    The child also gets a fresh queue: the inherited one may have been
+    forked mid-get() by the parent's listener. Records the parent had
+    queued but not yet written stay with the parent, which writes them.
+    """
+    global _LISTENER, _LOG_QUEUE
+    if _LISTENER is None:
+        return
+    _LOG_QUEUE = queue.SimpleQueue()
+    _LISTENER = None
+    _start_listener()
+
+
+def _flush_and_lock_before_fork() -> None:
+    """
+    Fork hook: empty the write buffers and hold the handler locks.
+
+    Otherwise a child would inherit, and later flush a second time, the
+    records still sitting in a buffer. The locks keep the listener from
+    writing between the flush and the fork; the child gets fresh locks
+    from logging's own fork hook.
+    """
+    for handler in list(_BUFFERED_HANDLERS):
+        handler.acquire()
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+
+def _unlock_after_fork_in_parent() -> None:
+    for handler in list(_BUFFERED_HANDLERS):
+        handler.release()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_flush_and_lock_before_fork,
+        after_in_parent=_unlock_after_fork_in_parent,
+        after_in_child=_restart_listener_in_child,
+    )
+
+
+def _queued(targets: Iterable[Tuple[logging.Handler, int]]) -> QueueHandler:
+    """
+    Put ``(handler, level)`` targets behind the shared queue.
+
+    Returns the QueueHandler to attach to a logger; the real handlers are
+    only ever called from the listener thread. The level is per target
+    because file handlers are shared between loggers (see
+    create_rotating_handler).
+    """
+    _start_listener()
+    targets = [(h, level) for h, level in targets if not isinstance(h, logging.NullHandler)]
+    return _RoutingQueueHandler(_LOG_QUEUE, targets)
+
+
 # --------------------------------------------------------------------------- #
 #  Logger Setup Functions
 # --------------------------------------------------------------------------- #
+_LOG_DIR_READY = False
+
+
+def _ensure_log_dir() -> None:
+    """Create LOG_DIR on first use, so importing the module touches no files."""
+    global _LOG_DIR_READY
+    if not _LOG_DIR_READY:
+        if not LOG_DIR.is_dir():
+            LOG_DIR.mkdir(parents=True, exist_ok=True)
+        _LOG_DIR_READY = True
+
+
+# Rotating handlers shared by every logger: one per (file, format, rotation
+# settings), so each log file is opened, buffered and rotated exactly once
+_HANDLER_CACHE: Dict[tuple, RotatingFileHandler] = {}
+_HANDLER_CACHE_LOCK = threading.Lock()
+
+
 def create_rotating_handler(
     filepath: Path,
     level: int = logging.DEBUG,
@@ -57,7 +497,11 @@ def create_rotating_handler(
     detailed: bool = True,
 ) -> RotatingFileHandler:
     """
-    Create a rotating file handler.
+    Create (or reuse) a buffered rotating file handler.
+
+    Handlers are cached per resolved file path, format and rotation
+    settings. A shared handler keeps the lowest level it was requested
+    with; the setup functions below filter per logger through the queue.
 
     Parameters
     ----------
@@ -70,35 +514,68 @@ def create_rotating_handler(
     backup_count : int
         Number of backup files to keep (default: 5)
     detailed : bool
-        If True, use detailed format; otherwise use simple format
+        If True, use detailed format; otherwise use HOT_FORMAT
 
     Returns
     -------
     RotatingFileHandler
-        Configured rotating file handler
+        Configured BufferedRotatingFileHandler
     """
-    handler = RotatingFileHandler(
-        filepath,
-        maxBytes=max_bytes,
-        backupCount=backup_count,
-        encoding="utf-8",
-    )
-    handler.setLevel(level)
+    key = (str(Path(filepath).resolve()), detailed, max_bytes, backup_count)
+    with _HANDLER_CACHE_LOCK:
+        handler = _HANDLER_CACHE.get(key)
+        if handler is not None:
+            if level < handler.level:
+                handler.setLevel(level)
+            return handler
 
-    fmt = DETAILED_FORMAT if detailed else SIMPLE_FORMAT
-    formatter = logging.Formatter(fmt, datefmt=DATE_FORMAT)
-    handler.setFormatter(formatter)
+        _ensure_log_dir()
+        handler = BufferedRotatingFileHandler(
+            filepath,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        handler.setLevel(level)
+
+        handler.setFormatter(_DETAILED_FORMATTER if detailed else _HOT_FORMATTER)
+
+        _HANDLER_CACHE[key] = handler
+        return handler
+
+
+# The app and error log handlers, attached by identity by every setup
+# function below and created on first use. They accept every level: each
+# logger's own levels are applied by the queue routing.
+_APP_HANDLER: Optional[RotatingFileHandler] = None
+_ERROR_HANDLER: Optional[RotatingFileHandler] = None
 
-    return handler
+
+def _app_handler() -> RotatingFileHandler:
+    global _APP_HANDLER
+    if _APP_HANDLER is None:
+        _APP_HANDLER = create_rotating_handler(APP_LOG_FILE, level=logging.DEBUG, detailed=False)
+    return _APP_HANDLER
+
+
+def _error_handler() -> RotatingFileHandler:
+    global _ERROR_HANDLER
+    if _ERROR_HANDLER is None:
+        _ERROR_HANDLER = create_rotating_handler(ERROR_LOG_FILE, level=logging.DEBUG, detailed=True)
+    return _ERROR_HANDLER
 
 
 def create_console_handler(
     level: int = logging.INFO,
     detailed: bool = False,
-) -> logging.StreamHandler:
+) -> logging.Handler:
     """
     Create a console (stdout) handler.
 
+    When stdout is not a terminal (piped, redirected, or the MCP stdio
+    transport, where stdout is the protocol stream) a NullHandler is
+    returned instead; the log files still get every record.
+
     Parameters
     ----------
     level : int
@@ -108,19 +585,25 @@ def create_console_handler(
 
     Returns
     -------
-    StreamHandler
-        Configured console handler
+    Handler
+        Configured console handler, or a NullHandler
     """
+    if sys.stdout is None or not sys.stdout.isatty():
+        return logging.NullHandler()
+
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(level)
 
-    fmt = DETAILED_FORMAT if detailed else SIMPLE_FORMAT
-    formatter = logging.Formatter(fmt, datefmt=DATE_FORMAT)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_DETAILED_FORMATTER if detailed else _SIMPLE_FORMATTER)
 
     return handler
 
 
+# Logger name -> the setup call and arguments it was last configured with;
+# repeating an identical call leaves the logger as it is
+_CONFIGURED: Dict[str, tuple] = {}
+
+
 def setup_logger(
     name: str,
     log_file: Optional[Path] = None,
@@ -150,39 +633,43 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    key = ("setup_logger", str(log_file), console_level, file_level, detailed_console)
+    if _CONFIGURED.get(name) == key:
+        return logger
+
     logger.setLevel(logging.DEBUG)  # Capture everything, handlers will filter
     logger.propagate = False  # Don't propagate to root logger to avoid duplicates
 
     # Remove ALL existing handlers to avoid duplicates
-    # Force clear by creating a new empty list
-    logger.handlers = []
+    logger.handlers.clear()
 
-    # File handler - rotating with detailed format
+    # File handler - rotating with the compact file format
     if log_file is None:
-        log_file = APP_LOG_FILE
-
-    file_handler = create_rotating_handler(
-        log_file,
-        level=file_level,
-        detailed=True,
-    )
-    logger.addHandler(file_handler)
+        file_handler = _app_handler()
+    else:
+        file_handler = create_rotating_handler(
+            log_file,
+            level=file_level,
+            detailed=False,
+        )
 
     # Console handler - simple format by default
     console_handler = create_console_handler(
         level=console_level,
         detailed=detailed_console,
     )
-    logger.addHandler(console_handler)
 
     # Error handler - separate file for errors and critical issues
-    error_handler = create_rotating_handler(
-        ERROR_LOG_FILE,
-        level=logging.ERROR,
-        detailed=True,
-    )
-    logger.addHandler(error_handler)
+    error_handler = _error_handler()
+
+    # The logger itself only enqueues; the listener thread writes
+    logger.addHandler(_queued([
+        (file_handler, file_level),
+        (console_handler, console_level),
+        (error_handler, logging.ERROR),
+    ]))
 
+    _CONFIGURED[name] = key
     return logger
 
 
@@ -194,7 +681,9 @@ def configure_root_logger(
     Configure the root logger with rotating file handlers.
 
     This affects all loggers in the application unless they explicitly
-    propagate=False.
+    propagate=False. The "logging system initialized" message is written
+    here, once the handlers are in place (importing the module logs
+    nothing).
 
     Parameters
     ----------
@@ -204,34 +693,35 @@ def configure_root_logger(
         Logging level for file output (default: INFO)
     """
     root_logger = logging.getLogger()
+    key = ("configure_root_logger", console_level, file_level)
+    if _CONFIGURED.get(root_logger.name) == key:
+        return
+
     root_logger.setLevel(logging.DEBUG)
 
     # Clear ALL existing handlers to avoid duplicates
-    # Force clear by creating a new empty list
-    root_logger.handlers = []
+    root_logger.handlers.clear()
 
     # Add rotating file handler
-    file_handler = create_rotating_handler(
-        APP_LOG_FILE,
-        level=file_level,
-        detailed=True,
-    )
-    root_logger.addHandler(file_handler)
+    file_handler = _app_handler()
 
     # Add console handler
     console_handler = create_console_handler(
         level=console_level,
         detailed=False,
     )
-    root_logger.addHandler(console_handler)
 
     # Add error file handler
-    error_handler = create_rotating_handler(
-        ERROR_LOG_FILE,
-        level=logging.ERROR,
-        detailed=True,
-    )
-    root_logger.addHandler(error_handler)
+    error_handler = _error_handler()
+
+    root_logger.addHandler(_queued([
+        (file_handler, file_level),
+        (console_handler, console_level),
+        (error_handler, logging.ERROR),
+    ]))
+
+    _CONFIGURED[root_logger.name] = key
+    _log_initialization()
 
 
 def get_ingestion_logger(name: str = "ingestion") -> logging.Logger:
@@ -251,47 +741,62 @@ def get_ingestion_logger(name: str = "ingestion") -> logging.Logger:
         Configured ingestion logger
     """
     logger = logging.getLogger(name)
+    key = ("get_ingestion_logger",)
+    if _CONFIGURED.get(name) == key:
+        return logger
+
     logger.setLevel(logging.DEBUG)
     logger.propagate = False  # Don't propagate to root logger
 
     # Remove ALL existing handlers to avoid duplicates
-    # Force clear by creating a new empty list
-    logger.handlers = []
+    logger.handlers.clear()
 
     # Ingestion-specific file handler
     ingestion_handler = create_rotating_handler(
         INGESTION_LOG_FILE,
         level=logging.DEBUG,
-        detailed=True,
+        detailed=False,
     )
-    logger.addHandler(ingestion_handler)
 
     # Also log to main app file
-    app_handler = create_rotating_handler(
-        APP_LOG_FILE,
-        level=logging.INFO,
-        detailed=True,
-    )
-    logger.addHandler(app_handler)
+    app_handler = _app_handler()
 
     # Console handler for immediate feedback
     console_handler = create_console_handler(
         level=logging.INFO,
         detailed=False,
     )
-    logger.addHandler(console_handler)
 
     # Error handler
-    error_handler = create_rotating_handler(
-        ERROR_LOG_FILE,
-        level=logging.ERROR,
-        detailed=True,
-    )
-    logger.addHandler(error_handler)
+    error_handler = _error_handler()
 
+    logger.addHandler(_queued([
+        (ingestion_handler, logging.DEBUG),
+        (app_handler, logging.INFO),
+        (console_handler, logging.INFO),
+        (error_handler, logging.ERROR),
+    ]))
+
+    _CONFIGURED[name] = key
     return logger
 
 
+@functools.lru_cache(maxsize=1)
+def _system_info_lines() -> Tuple[str, ...]:
+    """
+    Platform details, gathered once per process.
+
+    ``platform.platform()``/``processor()`` may shell out to ``uname`` or
+    query the registry, and none of it changes while the process runs.
+    """
+    return (
+        f"Python version: {sys.version}",
+        f"Platform: {platform.platform()}",
+        f"Architecture: {platform.machine()}",
+        f"Processor: {platform.processor()}",
+    )
+
+
 def log_system_info(logger: logging.Logger) -> None:
     """
     Log system and environment information.
@@ -301,18 +806,13 @@ def log_system_info(logger: logging.Logger) -> None:
     logger : Logger
         Logger instance to use
     """
-    import platform
-    import sys
-
     logger.info("=" * 80)
     logger.info("System Information")
     logger.info("=" * 80)
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Platform: {platform.platform()}")
-    logger.info(f"Architecture: {platform.machine()}")
-    logger.info(f"Processor: {platform.processor()}")
-    logger.info(f"Working directory: {Path.cwd()}")
-    logger.info(f"Log directory: {LOG_DIR.absolute()}")
+    for line in _system_info_lines():
+        logger.info("%s", line)
+    logger.info("Working directory: %s", Path.cwd())
+    logger.info("Log directory: %s", LOG_DIR.absolute())
     logger.info("=" * 80)
 
 
@@ -330,9 +830,9 @@ def log_exception(logger: logging.Logger, exc: Exception, context: str = "") ->
         Additional context about where/why the exception occurred
     """
     if context:
-        logger.error(f"Exception in {context}: {type(exc).__name__}: {exc}")
+        logger.error("Exception in %s: %s: %s", context, type(exc).__name__, exc)
     else:
-        logger.error(f"Exception: {type(exc).__name__}: {exc}")
+        logger.error("Exception: %s: %s", type(exc).__name__, exc)
 
     logger.exception("Full traceback:", exc_info=exc)
 
@@ -364,23 +864,28 @@ class PerformanceLogger:
         self.operation = operation
         self.start_time = None
 
+        # Messages built once per operation; "%" in the name is escaped in
+        # the two that are %-formatted with arguments
+        self._start_msg = "Starting: " + operation
+        name = operation.replace("%", "%%")
+        self._ok_fmt = "Completed: " + name + " in %.2fs"
+        self._err_fmt = "Failed: " + name + " after %.2fs - %s: %s"
+
     def __enter__(self):
         """Start timing."""
-        self.start_time = datetime.now()
-        self.logger.debug(f"Starting: {self.operation}")
+        self.start_time = time.perf_counter_ns()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._start_msg)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Log completion time and any exceptions."""
-        duration = (datetime.now() - self.start_time).total_seconds()
+        duration = (time.perf_counter_ns() - self.start_time) / 1e9
 
         if exc_type is None:
-            self.logger.info(f"Completed: {self.operation} in {duration:.2f}s")
+            self.logger.info(self._ok_fmt, duration)
         else:
-            self.logger.error(
-                f"Failed: {self.operation} after {duration:.2f}s - "
-                f"{exc_type.__name__}: {exc_val}"
-            )
+            self.logger.error(self._err_fmt, duration, exc_type.__name__, exc_val)
 
         # Don't suppress exceptions
         return False
@@ -392,10 +897,6 @@ class PerformanceLogger:
 def _log_initialization():
     """Log that the logging system has been initialized."""
     init_logger = logging.getLogger(__name__)
-    init_logger.info(f"Logging system initialized - logs directory: {LOG_DIR.absolute()}")
-    init_logger.debug(f"Log files: app={APP_LOG_FILE.name}, error={ERROR_LOG_FILE.name}, "
-                     f"ingestion={INGESTION_LOG_FILE.name}")
-
-
-# Auto-initialize when module is imported
-_log_initialization()
+    init_logger.info("Logging system initialized - logs directory: %s", LOG_DIR.absolute())
+    init_logger.debug("Log files: app=%s, error=%s, ingestion=%s",
+                      APP_LOG_FILE.name, ERROR_LOG_FILE.name, INGESTION_LOG_FILE.name)
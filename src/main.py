@@ -1,4 +1,5 @@
 import argparse
+import logging
 import sys
 import warnings
 
@@ -14,11 +15,42 @@ from logging_config import (
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
+
+def _build_cli_parser() -> argparse.ArgumentParser:
+    """
+    Build the command‑line parser.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        Parser with a single optional ``--transport`` argument.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the retriever with optional transport configuration."
+    )
+    parser.add_argument(
+        "--transport",
+        type=str,
+        default=None,
+        help=(
+            "Transport mode (e.g., 'stdio'). "
+            "If set to 'stdio', ``retrieve.mcp_io()`` will be executed. "
+            "Any other value is passed to ``retrieve.main`` as the ``transport`` "
+            "keyword argument."
+        ),
+    )
+    return parser
+
+
+# In stdio mode stdout carries the MCP protocol, so nothing may be logged to
+# the console; look at the transport before any handler is created
+_STDIO_TRANSPORT = _build_cli_parser().parse_known_args()[0].transport == "stdio"
+_CONSOLE_LEVEL = logging.CRITICAL + 1 if _STDIO_TRANSPORT else logging.INFO
+
 # Configure root logger with rotating file handlers
-configure_root_logger(console_level=20, file_level=10)  # INFO console, DEBUG file
+configure_root_logger(console_level=_CONSOLE_LEVEL, file_level=logging.DEBUG)  # INFO console (off for stdio), DEBUG file
 
 # Set levels for third-party loggers to reduce noise
-import logging
 logging.getLogger('chromadb').setLevel(logging.WARNING)
 logging.getLogger('sentence_transformers').setLevel(logging.WARNING)
 logging.getLogger('transformers').setLevel(logging.ERROR)
@@ -28,7 +60,7 @@ logging.getLogger('docket').setLevel(logging.WARNING)
 logging.getLogger('fakeredis').setLevel(logging.WARNING)
 
 # Create application logger
-logger = setup_logger(__name__)
+logger = setup_logger(__name__, console_level=_CONSOLE_LEVEL)
 
 from retriever import retrieve
 
@@ -42,21 +74,7 @@ def _parse_cli_args() -> argparse.Namespace:
     argparse.Namespace
         Parsed arguments with a single optional ``transport`` attribute.
     """
-    parser = argparse.ArgumentParser(
-        description="Run the retriever with optional transport configuration."
-    )
-    parser.add_argument(
-        "--transport",
-        type=str,
-        default=None,
-        help=(
-            "Transport mode (e.g., 'stdio'). "
-            "If set to 'stdio', ``retrieve.mcp_io()`` will be executed. "
-            "Any other value is passed to ``retrieve.main`` as the ``transport`` "
-            "keyword argument."
-        ),
-    )
-    return parser.parse_args()
+    return _build_cli_parser().parse_args()
 
 
 def _run() -> int:
@@ -75,7 +93,7 @@ def _run() -> int:
     log_system_info(logger)
 
     args = _parse_cli_args()
-    logger.info(f"Command-line arguments: transport={args.transport}")
+    logger.info("Command-line arguments: transport=%s", args.transport)
 
     try:
         with PerformanceLogger(logger, "Retriever execution"):
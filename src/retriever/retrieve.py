@@ -10,15 +10,23 @@ Now supports PDFs **and** Word / PowerPoint / Excel documents.
 #   Imports
 # ─────────────────────────────────────────────────────────────────────────────
 import sys
+import functools
+import hashlib
 import logging
+import os
 import re
-import pickle
+import threading
+import time
 from pathlib import Path
-from collections import defaultdict
+from stat import S_ISREG
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Tuple
 
 import chromadb
+import numpy as np
+import torch
 from fastmcp import FastMCP
 from fastmcp.server.http import StarletteWithLifespan
 from mcp_ui_server import create_ui_resource
@@ -49,6 +57,7 @@ from logging_config import (
     PerformanceLogger,
     log_system_info,
 )
+from bm25_index import load_index, meta_file
 
 # Create module logger with comprehensive configuration
 _logger = setup_logger(__name__)
@@ -89,6 +98,36 @@ SEM_WEIGHT = 0.7
 ENABLE_BM25 = True
 ENABLE_SEM = True
 
+# BM25 query tokenizer; must match the ingestor's (\w+ over lowercased text).
+# ASCII-only queries use an ASCII class, equivalent for them and cheaper
+# than Unicode category lookups.
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_WORD_RE_ASCII = re.compile(r"[a-z0-9_]+", re.ASCII)
+
+# Metadata page size when listing documents
+LIST_PAGE_SIZE = 10000
+
+# Reranker passage budget in tokens (query and special tokens come on top).
+# A full CHUNK_SIZE (800 char) chunk is ~200 tokens; the old 512-character
+# cut gave ~120 English tokens but more for Arabic. Passages are pre-sliced
+# to RERANK_PASSAGE_TOKENS * 8 characters to bound the tokenizer's work.
+RERANK_PASSAGE_TOKENS = 256
+
+# Intra-op threads for the torch models (roughly the physical cores: single
+# queries are short sequences and oversubscribing SMT siblings hurts)
+TORCH_THREADS = max(1, (os.cpu_count() or 2) // 2)
+
+# Device for the torch models: CUDA in half precision when a GPU is present
+DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+MODEL_DTYPE = torch.float16 if DEVICE == "cuda" else torch.float32
+
+# CrossEncoder mini-batch size; pairs are length-sorted first, so each batch
+# pads only to its own longest pair (candidates are ~25, see search())
+RERANK_BATCH_SIZE = 8
+
+# query cache (embeddings and final search results)
+cache_config = {"max_size": 2000, "ttl_seconds": 600}
+
 # Configure offline mode for HuggingFace models
 config.configure_offline_mode()
 
@@ -104,15 +143,98 @@ _bm25: "Dict[str, Any] | None" = None
 _reranker: "CrossEncoder | None" = None
 _mcp_app: "StarletteWithLifespan | None" = None
 
+# Runs the semantic and BM25 searches of one request side by side (the
+# embedder forward pass, ChromaDB and numpy all release the GIL)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
+
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#   Query cache
+# ─────────────────────────────────────────────────────────────────────────────
+class QueryCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live.
+
+    Keys are SHA-256 digests of the normalized query (see ``key``), so
+    repeated queries skip the embedder, ChromaDB, BM25 and the reranker.
+
+    Parameters
+    ----------
+    max_size : int
+        Number of entries kept; the least recently used one is evicted first
+    ttl_seconds : float
+        Lifetime of an entry
+    """
+
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    @staticmethod
+    def key(kind: str, query: str, *extra: Any) -> str:
+        """Digest of ``kind`` and the whitespace-normalized query (plus ``extra``)."""
+        normalized = " ".join(query.split())
+        parts = ":".join([kind, normalized, *map(str, extra)])
+        return hashlib.sha256(parts.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = QueryCache(**cache_config)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #   Helper / lifecycle utilities
 # ─────────────────────────────────────────────────────────────────────────────
+def _index_generation() -> "Tuple[int, int] | None":
+    """
+    Identity of the BM25 index on disk, part of every cached result key.
+
+    Ingestion deletes the index when it clears the collection and writes a
+    new one (metadata file last) when it finishes, so cached results never
+    outlive a re-ingest. None while no index exists.
+    """
+    for path in (meta_file(BM25_IDX), BM25_IDX):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        return st.st_mtime_ns, st.st_ino
+    return None
+
+
 def _invalidate_cache(clear_collection=True, clear_bm25=True):
     """
     Invalidate cached resources that may become stale after ingestion.
 
+    Cached search results are always dropped; they were computed from the
+    old collection / index.
+
     Parameters
     ----------
     clear_collection : bool
@@ -122,6 +244,8 @@ def _invalidate_cache(clear_collection=True, clear_bm25=True):
     """
     global _collection, _bm25
 
+    _cache.clear()
+
     if clear_collection and _collection is not None:
         _logger.info("Invalidating cached ChromaDB collection")
         _collection = None
@@ -131,6 +255,18 @@ def _invalidate_cache(clear_collection=True, clear_bm25=True):
         _bm25 = None
 
 
+def _configure_torch() -> None:
+    """Pin torch's thread pools before the first model runs."""
+    _logger.info(f"torch device: {DEVICE} ({MODEL_DTYPE})")
+    torch.set_num_threads(TORCH_THREADS)
+    try:
+        # Only allowed before any inter-op work has started
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        _logger.debug("torch inter-op threads already initialised - leaving as is")
+    _logger.info(f"torch threads: intra-op={torch.get_num_threads()}, inter-op={torch.get_num_interop_threads()}")
+
+
 def _load_resources(force_reload_collection=False, force_reload_bm25=False) -> Tuple[
     SentenceTransformer,
     chromadb.PersistentClient,
@@ -151,13 +287,27 @@ def _load_resources(force_reload_collection=False, force_reload_bm25=False) -> T
     global _model, _client, _collection, _bm25, _reranker
 
     try:
+        if _model is None and _reranker is None:
+            _configure_torch()
+
+        if _model is None and config.EMBEDDER_BACKEND == "onnx-int8":
+            # Same backend as ingestion, so queries and chunks share one vector space
+            from ingestor.onnx_embedder import OnnxEmbedder
+
+            _logger.info("Loading INT8 ONNX embedder...")
+            _logger.debug(f"Model path: {EMBED_MODEL}")
+            with PerformanceLogger(_logger, "Loading INT8 ONNX embedder"):
+                _model = OnnxEmbedder(EMBED_MODEL)
+            _logger.info("INT8 ONNX embedder loaded successfully")
+
         if _model is None:
             _logger.info("Loading SentenceTransformer model...")
             _logger.debug(f"Model path: {EMBED_MODEL}")
             with PerformanceLogger(_logger, "Loading SentenceTransformer model"):
                 _model = SentenceTransformer(
                     str(EMBED_MODEL),
-                    device="cpu",
+                    device=DEVICE,
+                    model_kwargs={"torch_dtype": MODEL_DTYPE},
                     local_files_only=True,
                     tokenizer_kwargs={"clean_up_tokenization_spaces": True, "fix_mistral_regex": True},
                 )
@@ -176,8 +326,11 @@ def _load_resources(force_reload_collection=False, force_reload_bm25=False) -> T
             _logger.info(f"Fetching collection: {config.VECTOR_DB_COLLECTION_NAME}")
             with PerformanceLogger(_logger, f"Fetching collection {config.VECTOR_DB_COLLECTION_NAME}"):
                 _collection = _client.get_collection(config.VECTOR_DB_COLLECTION_NAME)
-            collection_count = _collection.count()
-            _logger.info(f"Collection loaded successfully with {collection_count} items")
+            if _logger.isEnabledFor(logging.INFO):
+                # count() is a COUNT(*) on the sqlite store; only run it to log it
+                _logger.info(f"Collection loaded successfully with {_collection.count()} items")
+                hnsw = (getattr(_collection, "configuration", None) or {}).get("hnsw")
+                _logger.info(f"Collection HNSW configuration: {hnsw}")
 
         if _bm25 is None or force_reload_bm25:
             if force_reload_bm25 and _bm25 is not None:
@@ -185,7 +338,7 @@ def _load_resources(force_reload_collection=False, force_reload_bm25=False) -> T
             _logger.info("Loading BM25 index...")
             _logger.debug(f"BM25 index path: {BM25_IDX}")
             with PerformanceLogger(_logger, "Loading BM25 index"):
-                _bm25 = pickle.load(open(BM25_IDX, "rb"))
+                _bm25 = load_index(BM25_IDX)
             bm25_chunks = len(_bm25.get("chunks", []))
             _logger.info(f"BM25 index loaded successfully with {bm25_chunks} chunks")
 
@@ -193,7 +346,12 @@ def _load_resources(force_reload_collection=False, force_reload_bm25=False) -> T
             _logger.info("Loading CrossEncoder reranker...")
             _logger.debug(f"Reranker model path: {RERANK_MODEL}")
             with PerformanceLogger(_logger, "Loading CrossEncoder reranker"):
-                _reranker = CrossEncoder(str(RERANK_MODEL), max_length=512, device="cpu")
+                _reranker = CrossEncoder(
+                    str(RERANK_MODEL),
+                    max_length=512,
+                    device=DEVICE,
+                    model_kwargs={"torch_dtype": MODEL_DTYPE},
+                )
             _logger.info("CrossEncoder reranker loaded successfully")
 
         _logger.debug("All resources loaded and ready")
@@ -212,6 +370,8 @@ async def _cleanup() -> None:
     _logger.info("Starting cleanup of loaded resources...")
     _logger.info("=" * 80)
 
+    _cache.clear()
+
     globals_to_clear = ["_client", "_model", "_reranker", "_collection", "_bm25"]
     cleared_count = 0
     failed_count = 0
@@ -295,6 +455,17 @@ class ListDocumentsResults(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────────
 #   Core search logic
 # ─────────────────────────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=32)
+def _chroma_query_kwargs(n_results: int) -> Dict[str, Any]:
+    """
+    ``collection.query`` arguments for ``n_results`` hits, built once per size.
+
+    max_results is clamped to 1-25, so there are only a few distinct sizes.
+    The dict is shared; callers unpack it and must not modify it.
+    """
+    return {"n_results": n_results, "include": ["documents", "metadatas", "distances"]}
+
+
 def _semantic_search(
         model: SentenceTransformer,
         collection: chromadb.Collection,
@@ -305,14 +476,27 @@ def _semantic_search(
     try:
         _logger.debug(f"Starting semantic search for query: '{query[:100]}...' (top_k={top_k})")
 
-        with PerformanceLogger(_logger, "Semantic search encoding"):
-            emb = model.encode([f"query: {query}"], normalize_embeddings=True)[0]
+        emb_key = QueryCache.key("emb", query)
+        emb = _cache.get(emb_key)
+        if emb is None:
+            with PerformanceLogger(_logger, "Semantic search encoding"):
+                with torch.inference_mode():
+                    emb = model.encode([f"query: {query}"], normalize_embeddings=True)[0]
+            _cache.set(emb_key, emb)
+        else:
+            _logger.debug("Query embedding served from cache")
 
         with PerformanceLogger(_logger, "Semantic search query"):
-            raw = collection.query(query_embeddings=[emb.tolist()], n_results=top_k * 2)
+            # (1, d) array as-is, no Python float list; embeddings are not sent back
+            raw = collection.query(query_embeddings=emb.reshape(1, -1), **_chroma_query_kwargs(top_k * 2))
 
+        # Stored metadata was validated at ingestion; skip re-validating every hit
         results = [
-            SearchResult(metadata=ChunkMetadata(**md), text=txt, score=(1 - dist) * SEM_WEIGHT)
+            SearchResult.model_construct(
+                metadata=ChunkMetadata.model_construct(**md),
+                text=txt,
+                score=(1 - dist) * SEM_WEIGHT,
+            )
             for txt, md, dist in zip(raw["documents"][0], raw["metadatas"][0], raw["distances"][0])
         ]
 
@@ -333,7 +517,8 @@ def _bm25_search(bm25: Dict[str, Any], query: str, top_k: int) -> List[SearchRes
         _logger.debug(f"Starting BM25 search for query: '{query[:100]}...' (top_k={top_k})")
 
         with PerformanceLogger(_logger, "BM25 tokenization and scoring"):
-            tokens = re.findall(r"\w+", query.lower())
+            lowered = query.lower()
+            tokens = (_WORD_RE_ASCII if lowered.isascii() else _WORD_RE).findall(lowered)
             _logger.debug(f"Query tokenized into {len(tokens)} tokens")
             scores = bm25["bm25"].get_scores(tokens)
 
@@ -341,20 +526,24 @@ def _bm25_search(bm25: Dict[str, Any], query: str, top_k: int) -> List[SearchRes
             _logger.warning("BM25 search returned empty scores")
             return []
 
-        # top‑k*2 indices, descending
-        top_idx = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[: top_k * 2]
-        max_score = max(scores[i] for i in top_idx) or 1
+        # top‑k*2 indices, descending: partial selection, then sort only those
+        k = min(top_k * 2, scores.size)
+        top_idx = np.argpartition(scores, -k)[-k:]
+        top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+        max_score = scores[top_idx[0]] or 1
 
+        chunks = bm25["chunks"]
+        metadatas = bm25.get("metadatas", [{}])
         results: List[SearchResult] = []
         for i in top_idx:
             if scores[i] <= 0:
                 continue
-            meta = bm25.get("metadatas", [{}])[i] or {}
+            meta = metadatas[i] or {}
             results.append(
-                SearchResult(
-                    text=bm25["chunks"][i],
-                    metadata=ChunkMetadata(**meta) if meta else ChunkMetadata(**{}),  # type: ignore[arg-type]
-                    score=(scores[i] / max_score) * (1 - SEM_WEIGHT),
+                SearchResult.model_construct(
+                    text=chunks[i],
+                    metadata=ChunkMetadata.model_construct(**meta),
+                    score=float(scores[i] / max_score) * (1 - SEM_WEIGHT),
                 )
             )
 
@@ -373,11 +562,12 @@ def _deduplicate_and_sort(results: List[SearchResult]) -> List[SearchResult]:
     """Remove duplicate results and sort by score."""
     _logger.debug(f"Starting deduplication of {len(results)} results...")
 
+    # Keyed on the full text: str caches its hash, so this allocates nothing,
+    # and distinct chunks that share a prefix are no longer merged
     seen, uniq = set(), []
     for r in sorted(results, key=lambda x: x.score, reverse=True):
-        snippet = r.text[:100]
-        if snippet not in seen:
-            seen.add(snippet)
+        if r.text not in seen:
+            seen.add(r.text)
             uniq.append(r)
 
     removed_count = len(results) - len(uniq)
@@ -396,11 +586,33 @@ def _rerank(reranker: CrossEncoder, query: str, candidates: List[SearchResult])
         _logger.info(f"Reranking {len(candidates)} candidates...")
 
         with PerformanceLogger(_logger, "Preparing query-document pairs"):
-            pairs = [[query, c.text[:512]] for c in candidates]
+            # Truncate by tokens, not characters, so every passage gets the
+            # same budget whatever its script
+            tokenizer = reranker.tokenizer
+            enc = tokenizer(
+                [c.text[:RERANK_PASSAGE_TOKENS * 8] for c in candidates],
+                add_special_tokens=False,
+                truncation=True,
+                max_length=RERANK_PASSAGE_TOKENS,
+            )
+            token_ids = enc["input_ids"]
+            texts = tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+            # Shortest first, so each mini-batch is padded to similar lengths
+            order = np.argsort([len(ids) for ids in token_ids], kind="stable")
+            pairs = [[query, texts[i]] for i in order]
             _logger.debug(f"Created {len(pairs)} pairs for reranking")
 
         with PerformanceLogger(_logger, f"CrossEncoder.predict({len(pairs)} pairs)"):
-            scores = reranker.predict(pairs)
+            with torch.inference_mode():
+                sorted_scores = reranker.predict(
+                    pairs,
+                    batch_size=RERANK_BATCH_SIZE,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                )
+            # Back to candidate order
+            scores = np.empty_like(sorted_scores)
+            scores[order] = sorted_scores
             _logger.debug(f"Reranker returned {len(scores)} scores")
 
         with PerformanceLogger(_logger, "Assigning scores and sorting"):
@@ -441,13 +653,22 @@ def search(query: str, top_k: int = 10) -> List[SearchResult]:
     _logger.info(f"Requested results: {top_k}")
     _logger.info("=" * 80)
 
+    res_key = QueryCache.key("res", query, top_k, _index_generation())
+    cached = _cache.get(res_key)
+    if cached is not None:
+        _logger.info(f"Search Complete: Returning {len(cached)} cached results")
+        return list(cached)
+
     try:
-        return _search_with_retry(query, top_k)
+        results = _search_with_retry(query, top_k)
     except chromadb.errors.NotFoundError as nf_exc:
         # Collection was deleted and recreated - invalidate cache and retry once
         _logger.warning(f"Collection not found (stale cache) - reloading and retrying search: {nf_exc}")
         _invalidate_cache(clear_collection=True, clear_bm25=True)
-        return _search_with_retry(query, top_k, force_reload=True)
+        results = _search_with_retry(query, top_k, force_reload=True)
+
+    _cache.set(res_key, list(results))
+    return results
 
 
 def _search_with_retry(query: str, top_k: int, force_reload: bool = False) -> List[SearchResult]:
@@ -463,21 +684,25 @@ def _search_with_retry(query: str, top_k: int, force_reload: bool = False) -> Li
 
         results: List[SearchResult] = []
 
+        # Start both searches first; they are independent and run concurrently
+        fut_sem = _executor.submit(_semantic_search, model, collection, query, top_k) if ENABLE_SEM else None
+        fut_bm25 = _executor.submit(_bm25_search, bm25, query, top_k) if ENABLE_BM25 else None
+
         # Perform semantic search if enabled
-        if ENABLE_SEM:
+        if fut_sem is not None:
             _logger.info("Semantic search: ENABLED")
             with PerformanceLogger(_logger, "Semantic search (total)"):
-                sem_results = _semantic_search(model, collection, query, top_k)
+                sem_results = fut_sem.result()
             results.extend(sem_results)
             _logger.info(f"→ Semantic search added {len(sem_results)} results")
         else:
             _logger.info("Semantic search: DISABLED")
 
         # Perform BM25 search if enabled
-        if ENABLE_BM25:
+        if fut_bm25 is not None:
             _logger.info("BM25 search: ENABLED")
-            with PerformanceLogger(_logger, "BM25 search (total)"):
-                bm25_results = _bm25_search(bm25, query, top_k)
+            with PerformanceLogger(_logger, "BM25 search (wait)"):
+                bm25_results = fut_bm25.result()
             results.extend(bm25_results)
             _logger.info(f"→ BM25 search added {len(bm25_results)} results")
         else:
@@ -633,6 +858,55 @@ def _scan_documents_from_filesystem() -> List[Dict[str, Any]]:
     return files
 
 
+def _aggregate_indexed_metadata(collection: chromadb.Collection) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-filename chunk counts, pages and sheet titles of the indexed chunks.
+
+    Only metadatas are fetched (no documents or embeddings), LIST_PAGE_SIZE
+    at a time, so memory stays bounded by one page plus the aggregate.
+    """
+    indexed_metadata: Dict[str, Dict[str, Any]] = {}
+    total_items = 0
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], offset=offset, limit=LIST_PAGE_SIZE)
+        metadatas = page.get("metadatas") or []
+        if not metadatas:
+            break
+
+        for meta in metadatas:
+            meta = meta or {}
+            filename = meta.get("filename", "unknown")
+            entry = indexed_metadata.get(filename)
+            if entry is None:
+                entry = indexed_metadata[filename] = {
+                    "chunks": 0,
+                    "pages": set(),
+                    "sheet_titles": set(),
+                    "meta": {
+                        "total_pages": meta.get("total_pages", 0),
+                        "lang": meta.get("lang", "unknown"),
+                        "created_at": meta.get("created_at"),
+                        "file_type": meta.get("file_type"),
+                    }
+                }
+
+            entry["chunks"] += 1
+            entry["pages"].add(meta.get("page"))
+
+            # Collect sheet titles (for Excel files)
+            if st := meta.get("sheet_title"):
+                entry["sheet_titles"].add(st)
+
+        total_items += len(metadatas)
+        if len(metadatas) < LIST_PAGE_SIZE:
+            break
+        offset += LIST_PAGE_SIZE
+
+    _logger.info(f"Processed {total_items} metadata items from ChromaDB")
+    return indexed_metadata
+
+
 def _list_documents_internal() -> ListDocumentsResults:
     """
     Internal function: List all documents from filesystem, enriched with ChromaDB indexing data.
@@ -649,52 +923,26 @@ def _list_documents_internal() -> ListDocumentsResults:
         _logger.debug("Scanning filesystem for documents...")
         filesystem_docs = _scan_documents_from_filesystem()
 
-        # Step 2: Get indexed documents from ChromaDB
+        # Step 2 + 3: Page through the ChromaDB metadata, indexed by filename
         _logger.debug("Loading collection for document listing...")
+        indexed_metadata: Dict[str, Dict[str, Any]] = {}
         try:
             _, _, collection, _, _ = _load_resources()
-            _logger.debug("Fetching all documents from collection...")
+            _logger.debug("Fetching document metadata from collection...")
             try:
-                chroma_data = collection.get()
+                indexed_metadata = _aggregate_indexed_metadata(collection)
             except chromadb.errors.NotFoundError as nf_exc:
                 # Collection was deleted and recreated (e.g., during ingestion)
                 # Invalidate cache and retry with fresh collection
                 _logger.warning(f"Collection not found (stale cache) - reloading: {nf_exc}")
                 _invalidate_cache(clear_collection=True, clear_bm25=True)
                 _, _, collection, _, _ = _load_resources(force_reload_collection=True, force_reload_bm25=True)
-                chroma_data = collection.get()
+                indexed_metadata = _aggregate_indexed_metadata(collection)
         except Exception as e:
             _logger.warning(f"Could not load ChromaDB collection: {e}")
-            chroma_data = {"metadatas": []}
-
-        # Step 3: Build index of ChromaDB metadata by filename
-        indexed_metadata: Dict[str, Dict[str, Any]] = {}
-        if chroma_data and chroma_data.get("metadatas"):
-            total_items = len(chroma_data["metadatas"])
-            _logger.info(f"Processing {total_items} metadata items from ChromaDB...")
-
-            for meta in chroma_data["metadatas"]:
-                filename = meta.get("filename", "unknown")
-                if filename not in indexed_metadata:
-                    indexed_metadata[filename] = {
-                        "chunks": 0,
-                        "pages": set(),
-                        "sheet_titles": set(),
-                        "meta": {
-                            "total_pages": meta.get("total_pages", 0),
-                            "lang": meta.get("lang", "unknown"),
-                            "created_at": meta.get("created_at"),
-                            "file_type": meta.get("file_type"),
-                        }
-                    }
-
-                indexed_metadata[filename]["chunks"] += 1
-                indexed_metadata[filename]["pages"].add(meta.get("page"))
-
-                # Collect sheet titles (for Excel files)
-                if st := meta.get("sheet_title"):
-                    indexed_metadata[filename]["sheet_titles"].add(st)
+            indexed_metadata = {}
 
+        if indexed_metadata:
             _logger.debug(f"Found {len(indexed_metadata)} unique documents in ChromaDB")
             _logger.info(f"ChromaDB filenames: {sorted(indexed_metadata.keys())}")
 
@@ -912,11 +1160,21 @@ def _validate_path_safety(file_path: Path, operation: str):
 # ─────────────────────────────────────────────────────────────────────────────
 #   PDF static serving
 # ─────────────────────────────────────────────────────────────────────────────
+def _regular_file_stat(path: Path) -> "os.stat_result | None":
+    """``os.stat`` of ``path`` if it is a regular file, else None."""
+    try:
+        st = path.stat()
+    except (OSError, ValueError):
+        return None
+    return st if S_ISREG(st.st_mode) else None
+
+
 async def serve_pdf(request):
     filename = request.path_params["filename"]
     pdf_path = DOCS_ROOT / filename
 
-    if not pdf_path.is_file():
+    # One stat, reused by FileResponse for the size / last-modified headers
+    if (stat_result := _regular_file_stat(pdf_path)) is None:
         _logger.warning("serve_pdf – file not found: %s", filename)
         return JSONResponse({"error": "PDF not found"}, status_code=404)
 
@@ -928,6 +1186,7 @@ async def serve_pdf(request):
     _logger.info("serve_pdf – streaming %s", pdf_path)
     return FileResponse(
         pdf_path,
+        stat_result=stat_result,
         media_type="application/pdf",
         headers={"Content-Disposition": f"inline; filename*=UTF-8''{enc_name}"},
     )
@@ -941,7 +1200,7 @@ async def serve_file(request):
     filename = request.path_params["filename"]
     file_path = DOCS_ROOT / filename
 
-    if not file_path.is_file():
+    if (stat_result := _regular_file_stat(file_path)) is None:
         _logger.warning("serve_file – not found: %s", filename)
         return JSONResponse({"error": "File not found"}, status_code=404)
 
@@ -956,6 +1215,7 @@ async def serve_file(request):
     _logger.info("serve_file – streaming %s as %s", file_path, mime)
     return FileResponse(
         file_path,
+        stat_result=stat_result,
         media_type=mime,
         headers={"Content-Disposition": f"inline; filename*=UTF-8''{enc_name}"},
     )